@@ -4,6 +4,9 @@ Configuration settings for PDF Text Summarizer
 
 import os
 from pathlib import Path
+from string import Formatter
+from types import MappingProxyType
+from typing import Callable
 
 # Application settings
 APP_NAME = "PDF Text Summarizer"
@@ -35,6 +38,28 @@ OPENAI_MAX_TOKENS = 1000
 OPENAI_TEMPERATURE = 0.3
 OPENAI_TOP_P = 0.9
 MAX_CHUNK_LENGTH = 12000  # Conservative limit for GPT-3.5-turbo
+MAX_CHUNK_TOKENS = 3000  # Same budget in tokens, used when tiktoken is installed
+MIN_TAIL_CHUNK_FRACTION = 0.25  # A last chunk below this share of the budget joins the one before it
+OPENAI_MAX_CONCURRENCY = 8  # Parallel chunk requests per document
+OPENAI_MAX_REQUESTS_PER_MINUTE = 500  # Client-side request budget (match your account tier)
+OPENAI_MAX_TOKENS_PER_MINUTE = 200000  # Client-side token budget (match your account tier)
+OPENAI_RATE_LIMIT_RETRIES = 5  # Retries of a chunk request rejected with HTTP 429
+OPENAI_BACKOFF_SECONDS = 1.0  # First retry delay; doubles on each further retry
+OPENAI_BATCH_MIN_CHUNKS = 8  # Chunk count at which the Batch API is used, when enabled
+OPENAI_BATCH_POLL_SECONDS = 10  # First Batch API status poll delay; doubles up to the max
+OPENAI_BATCH_MAX_POLL_SECONDS = 300
+OPENAI_MAP_MODEL = "gpt-4o-mini"  # Cheaper model for per-chunk summaries of long documents
+OPENAI_REDUCE_MODEL = OPENAI_MODEL  # Model for the final summary and the shortening pass
+
+# Summary cache settings
+SUMMARY_CACHE_DIR = os.getenv('SUMMARY_CACHE_DIR', os.path.join('~', '.cache', 'textsummarizer'))
+
+# VBee TTS settings
+VBEE_MAX_CONCURRENCY = 4  # Sections synthesized in parallel
+VBEE_MAX_RETRIES = 5  # Retries of a request answered with 429 or a 5xx status
+VBEE_BACKOFF_SECONDS = 0.5  # Backoff factor; the delay doubles on each further retry
+VOICE_CACHE_DIR = os.getenv('VOICE_CACHE_DIR', os.path.join('~', '.cache', 'textsummarizer', 'voice'))
+VOICE_CACHE_MAX_MB = 500  # Least recently used audio is evicted beyond this size
 
 # Traditional model settings (fallback)
 MAX_MODEL_LENGTH = 1024
@@ -42,8 +67,8 @@ MIN_SUMMARY_LENGTH = 50
 MAX_SUMMARY_LENGTH = 150
 
 # Reading metrics thresholds
-READABILITY_THRESHOLDS = {
-    'flesch_reading_ease': {
+READABILITY_THRESHOLDS = MappingProxyType({
+    'flesch_reading_ease': MappingProxyType({
         'very_easy': 90,
         'easy': 80,
         'fairly_easy': 70,
@@ -51,11 +76,20 @@ READABILITY_THRESHOLDS = {
         'fairly_difficult': 50,
         'difficult': 30,
         'very_difficult': 0
-    }
-}
+    })
+})
+
+# Flesch reading ease cutoffs in ascending order with their matching labels,
+# ready for bisect.bisect_right lookups
+_FLESCH_LEVELS = sorted(
+    (threshold, label)
+    for label, threshold in READABILITY_THRESHOLDS['flesch_reading_ease'].items()
+)
+FLESCH_CUTOFFS = tuple(threshold for threshold, _ in _FLESCH_LEVELS)
+FLESCH_LABELS = tuple(label for _, label in _FLESCH_LEVELS)
 
 # Error messages
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     'file_not_found': "PDF file not found: {file_path}",
     'invalid_file_type': "File must be a PDF document (.pdf extension)",
     'file_too_large': "File size exceeds maximum allowed size of {max_size}MB",
@@ -67,11 +101,38 @@ ERROR_MESSAGES = {
     'openai_api_error': "OpenAI API error: {error_message}",
     'openai_rate_limit': "OpenAI rate limit exceeded. Please try again later",
     'openai_quota_exceeded': "OpenAI quota exceeded. Please check your billing"
-}
+})
 
 # Success messages
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = MappingProxyType({
     'processing_complete': "PDF processing completed successfully",
     'summary_saved': "Summary saved to: {output_path}",
     'text_extracted': "Successfully extracted {word_count} words from PDF"
-}
+})
+
+
+def _compile_message(template: str) -> Callable[..., str]:
+    """
+    Compile a message template into a function taking its fields as keywords.
+    
+    The template is parsed once here; the returned function evaluates an
+    f-string, so no format parsing happens when a message is emitted.
+    """
+    fields = [field for _, field, _, _ in Formatter().parse(template) if field is not None]
+    if not all(field.isidentifier() for field in fields):
+        raise ValueError(f"Message template fields must be plain names: {template!r}")
+    params = f"*, {', '.join(dict.fromkeys(fields))}" if fields else ""
+    return eval(f"lambda {params}: f{template!r}")
+
+
+# Compiled formatters for the message templates above; call with the
+# template's fields as keyword arguments, e.g.
+# ERROR_FORMATTERS['file_not_found'](file_path=path). The message text still
+# lives only in the dicts above.
+ERROR_FORMATTERS = MappingProxyType({
+    key: _compile_message(template) for key, template in ERROR_MESSAGES.items()
+})
+
+SUCCESS_FORMATTERS = MappingProxyType({
+    key: _compile_message(template) for key, template in SUCCESS_MESSAGES.items()
+})
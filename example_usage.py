@@ -3,20 +3,19 @@ Example usage of PDF Text Summarizer
 Demonstrates different ways to use the application programmatically.
 """
 
+import bisect
 import os
 import sys
-from pathlib import Path
-from main import PDFSummarizerApp
-from utils import validate_pdf_file, format_duration, format_word_count
-import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Application modules (and their OpenAI/PDF dependencies) are imported
+# inside the examples that need them to keep startup cheap.
 
 
 def example_basic_usage():
     """Example of basic PDF summarization."""
+    from main import PDFSummarizerApp
+    from utils import format_duration, format_word_count
+    
     print("=" * 60)
     print("EXAMPLE 1: Basic PDF Summarization")
     print("=" * 60)
@@ -38,12 +37,15 @@ def example_basic_usage():
         # Process the PDF
         result = app.process_pdf(pdf_path, duration_minutes=15)
         
+        wc = format_word_count(result['word_count'])
+        dur = format_duration(result['estimated_duration_minutes'])
+        
         # Display results
         print(f"✓ Successfully processed: {result['pdf_path']}")
         print(f"✓ Pages: {result['pdf_page_count']}")
         print(f"✓ Original words: {format_word_count(result['original_word_count'])}")
-        print(f"✓ Summary words: {format_word_count(result['word_count'])}")
-        print(f"✓ Estimated duration: {format_duration(result['estimated_duration_minutes'])}")
+        print(f"✓ Summary words: {wc}")
+        print(f"✓ Estimated duration: {dur}")
         
         print("\nSummary Preview:")
         print("-" * 40)
@@ -56,6 +58,9 @@ def example_basic_usage():
 
 def example_custom_duration():
     """Example of custom video duration."""
+    from main import PDFSummarizerApp
+    from utils import format_duration, format_word_count
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 2: Custom Video Duration (10 minutes)")
     print("=" * 60)
@@ -71,9 +76,12 @@ def example_custom_duration():
         # Process for 10-minute video
         result = app.process_pdf(pdf_path, duration_minutes=10)
         
+        wc = format_word_count(result['word_count'])
+        dur = format_duration(result['estimated_duration_minutes'])
+        
         print(f"✓ Target duration: {format_duration(10)}")
-        print(f"✓ Actual duration: {format_duration(result['estimated_duration_minutes'])}")
-        print(f"✓ Word count: {format_word_count(result['word_count'])}")
+        print(f"✓ Actual duration: {dur}")
+        print(f"✓ Word count: {wc}")
         
         print("\nKey Points:")
         print("-" * 40)
@@ -86,6 +94,8 @@ def example_custom_duration():
 
 def example_file_validation():
     """Example of file validation."""
+    from utils import validate_pdf_file
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 3: File Validation")
     print("=" * 60)
@@ -118,12 +128,16 @@ def example_file_validation():
 
 def example_batch_processing():
     """Example of processing multiple PDFs."""
+    from main import PDFSummarizerApp
+    from utils import format_duration, format_word_count
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 4: Batch Processing")
     print("=" * 60)
     
-    # Find all PDF files in current directory
-    pdf_files = list(Path('.').glob('*.pdf'))
+    # Find PDF files in current directory (up to 3)
+    with os.scandir('.') as entries:
+        pdf_files = [e for e in entries if e.name.endswith('.pdf') and e.is_file()][:3]
     
     if not pdf_files:
         print("No PDF files found in current directory.")
@@ -132,18 +146,22 @@ def example_batch_processing():
     
     app = PDFSummarizerApp()
     
-    for pdf_file in pdf_files[:3]:  # Process up to 3 files
+    for pdf_file in pdf_files:
         print(f"\nProcessing: {pdf_file.name}")
         try:
-            result = app.process_pdf(str(pdf_file), duration_minutes=15)
-            print(f"✓ Success: {format_word_count(result['word_count'])} words, "
-                  f"{format_duration(result['estimated_duration_minutes'])}")
+            result = app.process_pdf(pdf_file.path, duration_minutes=15)
+            wc = format_word_count(result['word_count'])
+            dur = format_duration(result['estimated_duration_minutes'])
+            print(f"✓ Success: {wc}, {dur}")
         except Exception as e:
             print(f"✗ Error: {str(e)}")
 
 
 def example_reading_metrics():
     """Example of reading metrics analysis."""
+    from main import PDFSummarizerApp
+    from config import FLESCH_CUTOFFS, FLESCH_LABELS
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 5: Reading Metrics Analysis")
     print("=" * 60)
@@ -170,16 +188,8 @@ def example_reading_metrics():
             
             # Interpret readability
             ease_score = metrics.get('flesch_reading_ease', 0)
-            if ease_score >= 80:
-                level = "Very Easy"
-            elif ease_score >= 70:
-                level = "Easy"
-            elif ease_score >= 60:
-                level = "Standard"
-            elif ease_score >= 50:
-                level = "Fairly Difficult"
-            else:
-                level = "Difficult"
+            level_index = max(bisect.bisect_right(FLESCH_CUTOFFS, ease_score) - 1, 0)
+            level = FLESCH_LABELS[level_index].replace('_', ' ').title()
             
             print(f"\nReadability Level: {level}")
         else:
@@ -10,11 +10,11 @@ from pathlib import Path
 
 
 def run_command(command, description, silent=False):
-    """Run a command and handle errors."""
+    """Run a command (given as an argument list) and handle errors."""
     if not silent:
         print(f"Running: {description}")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         if not silent:
             print(f"✓ {description} completed successfully")
         return True
@@ -23,6 +23,11 @@ def run_command(command, description, silent=False):
             print(f"✗ {description} failed:")
             print(f"  Error: {e.stderr}")
         return False
+    except OSError as e:
+        if not silent:
+            print(f"✗ {description} failed:")
+            print(f"  Error: {e}")
+        return False
 
 
 def check_python_version():
@@ -42,13 +47,13 @@ def install_dependencies():
     print("\nInstalling dependencies...")
     
     # Check if uv is available
-    uv_available = run_command("uv --version", "Checking uv availability", silent=True)
+    uv_available = run_command(["uv", "--version"], "Checking uv availability", silent=True)
     
     if uv_available:
         print("✓ uv detected, using uv for installation")
         # Check if pyproject.toml exists
         if Path("pyproject.toml").exists():
-            success = run_command("uv sync", "Installing packages with uv")
+            success = run_command(["uv", "sync"], "Installing packages with uv")
         else:
             print("✗ pyproject.toml not found")
             return False
@@ -61,39 +66,15 @@ def install_dependencies():
         
         # Install packages with pip
         success = run_command(
-            f"{sys.executable} -m pip install -r requirements.txt",
+            [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
             "Installing Python packages with pip"
         )
     
     return success
 
 
-def download_nltk_data():
-    """Download required NLTK data."""
-    print("\nDownloading NLTK data...")
-    
-    nltk_script = """
-import nltk
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-    print("NLTK data downloaded successfully")
-except Exception as e:
-    print(f"Error downloading NLTK data: {e}")
-    exit(1)
-"""
-    
-    success = run_command(
-        f"{sys.executable} -c \"{nltk_script}\"",
-        "Downloading NLTK data"
-    )
-    
-    return success
-
-
 def test_installation():
-    """Test if the installation works."""
+    """Test the installation in a fresh interpreter."""
     print("\nTesting installation...")
     
     test_script = """
@@ -118,7 +99,7 @@ except ImportError as e:
 """
     
     success = run_command(
-        f"{sys.executable} -c \"{test_script}\"",
+        [sys.executable, "-c", test_script],
         "Testing module imports"
     )
     
@@ -186,11 +167,6 @@ def main():
         print("\n✗ Installation failed at dependency installation step")
         sys.exit(1)
     
-    # Download NLTK data
-    if not download_nltk_data():
-        print("\n✗ Installation failed at NLTK data download step")
-        sys.exit(1)
-    
     # Test installation
     if not test_installation():
         print("\n✗ Installation failed at testing step")
@@ -8,27 +8,56 @@ import sys
 import os
 import platform
 
+# Platform name, resolved once per run
+_SYSTEM = platform.system().lower()
+
+_WINDOWS_ACTIVATION_SCRIPT = """@echo off
+echo Activating PDF Text Summarizer environment...
+call .venv\\Scripts\\activate.bat
+echo Environment activated! You can now run:
+echo   python main.py your_document.pdf
+echo   python summary_cli.py summarize-pdf your_document.pdf
+echo   python voice_cli.py generate-voice summary.txt
+pause
+"""
+
+_UNIX_ACTIVATION_SCRIPT = """#!/bin/bash
+echo "Activating PDF Text Summarizer environment..."
+source .venv/bin/activate
+echo "Environment activated! You can now run:"
+echo "  python main.py your_document.pdf"
+echo "  python summary_cli.py summarize-pdf your_document.pdf"
+echo "  python voice_cli.py generate-voice summary.txt"
+"""
+
+# Per-platform (script file, script content, file mode, activation hints);
+# platforms not listed use the "unix" entry
+_ACTIVATION_SCRIPTS = {
+    "windows": ("activate_env.bat", _WINDOWS_ACTIVATION_SCRIPT, None,
+                ("Run: activate_env.bat", "Or: .venv\\Scripts\\activate")),
+    "unix": ("activate_env.sh", _UNIX_ACTIVATION_SCRIPT, 0o755,
+             ("Run: ./activate_env.sh", "Or: source .venv/bin/activate")),
+}
+_ACTIVATION = _ACTIVATION_SCRIPTS.get(_SYSTEM, _ACTIVATION_SCRIPTS["unix"])
+
 
 def install_uv():
     """Install uv package manager."""
     print("Installing uv package manager...")
     
-    system = platform.system().lower()
-    
     try:
-        if system == "windows":
+        if _SYSTEM == "windows":
             # Install uv on Windows
-            cmd = 'powershell -c "irm https://astral.sh/uv/install.ps1 | iex"'
-            subprocess.run(cmd, shell=True, check=True)
+            cmd = ["powershell", "-c", "irm https://astral.sh/uv/install.ps1 | iex"]
         else:
             # Install uv on macOS/Linux
-            cmd = "curl -LsSf https://astral.sh/uv/install.sh | sh"
-            subprocess.run(cmd, shell=True, check=True)
+            cmd = ["sh", "-c", "curl -LsSf https://astral.sh/uv/install.sh | sh"]
+        subprocess.run(cmd, check=True)
         
         print("✓ uv installed successfully")
         return True
         
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"✗ Failed to install uv: {e}")
         return False
 
@@ -54,34 +83,12 @@ def setup_project():
 
 def create_activation_script():
     """Create activation script for easy environment activation."""
-    system = platform.system().lower()
-    
-    if system == "windows":
-        script_content = """@echo off
-echo Activating PDF Text Summarizer environment...
-call .venv\\Scripts\\activate.bat
-echo Environment activated! You can now run:
-echo   python main.py your_document.pdf
-echo   python summary_cli.py summarize-pdf your_document.pdf
-echo   python voice_cli.py generate-voice summary.txt
-pause
-"""
-        with open("activate_env.bat", "w") as f:
-            f.write(script_content)
-        print("✓ Created activate_env.bat for easy environment activation")
-    else:
-        script_content = """#!/bin/bash
-echo "Activating PDF Text Summarizer environment..."
-source .venv/bin/activate
-echo "Environment activated! You can now run:"
-echo "  python main.py your_document.pdf"
-echo "  python summary_cli.py summarize-pdf your_document.pdf"
-echo "  python voice_cli.py generate-voice summary.txt"
-"""
-        with open("activate_env.sh", "w") as f:
-            f.write(script_content)
-        os.chmod("activate_env.sh", 0o755)
-        print("✓ Created activate_env.sh for easy environment activation")
+    script_name, script_content, mode, _ = _ACTIVATION
+    with open(script_name, "w") as f:
+        f.write(script_content)
+    if mode is not None:
+        os.chmod(script_name, mode)
+    print(f"✓ Created {script_name} for easy environment activation")
 
 
 def main():
@@ -112,12 +119,8 @@ def main():
     print("   - OpenAI: https://platform.openai.com/api-keys")
     print("   - VBee: Contact VBee for TTS API access")
     print("2. Activate environment:")
-    if platform.system().lower() == "windows":
-        print("   Run: activate_env.bat")
-        print("   Or: .venv\\Scripts\\activate")
-    else:
-        print("   Run: ./activate_env.sh")
-        print("   Or: source .venv/bin/activate")
+    for hint in _ACTIVATION[3]:
+        print(f"   {hint}")
     print("3. Run the application:")
     print("   python main.py your_document.pdf")
     print("\nFor help: python main.py --help")
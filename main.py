@@ -10,16 +10,10 @@ import sys
 from pathlib import Path
 from summary_tool import SummaryTool
 from voice_tool import VoiceTool
+from utils import configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('pdf_summarizer.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging (written by a background thread)
+configure_logging('pdf_summarizer.log')
 
 logger = logging.getLogger(__name__)
 
@@ -94,27 +88,30 @@ def main(pdf_path, output, duration, api_key, generate_voice, voice_output_dir,
         
         result = app.summary_tool.process_pdf(pdf_path, output, duration)
         
-        # Display results
-        click.echo("\n" + "="*60)
-        click.echo("SUMMARY COMPLETED SUCCESSFULLY!")
-        click.echo("="*60)
-        click.echo(f"Source PDF: {result['pdf_path']}")
-        click.echo(f"Pages processed: {result['pdf_page_count']}")
-        click.echo(f"Original words: {result['original_word_count']}")
-        click.echo(f"Summary words: {result['word_count']}")
-        click.echo(f"Estimated duration: {result['estimated_duration_minutes']} minutes")
-        click.echo(f"Summarization method: {result.get('summarization_method', 'openai').upper()}")
-        click.echo(f"Summary saved to: {output}")
+        # Display results as one block so the terminal is written once
+        lines = [
+            "\n" + "="*60,
+            "SUMMARY COMPLETED SUCCESSFULLY!",
+            "="*60,
+            f"Source PDF: {result['pdf_path']}",
+            f"Pages processed: {result['pdf_page_count']}",
+            f"Original words: {result['original_word_count']}",
+            f"Summary words: {result['word_count']}",
+            f"Estimated duration: {result['estimated_duration_minutes']} minutes",
+            f"Summarization method: {result.get('summarization_method', 'openai').upper()}",
+            f"Summary saved to: {output}",
+        ]
         
-        click.echo("\nSUMMARY PREVIEW:")
-        click.echo("-" * 40)
+        lines.append("\nSUMMARY PREVIEW:")
+        lines.append("-" * 40)
         preview = result['summary'][:500] + "..." if len(result['summary']) > 500 else result['summary']
-        click.echo(preview)
+        lines.append(preview)
         
-        click.echo("\nKEY POINTS:")
-        click.echo("-" * 40)
+        lines.append("\nKEY POINTS:")
+        lines.append("-" * 40)
         for i, point in enumerate(result['key_points'], 1):
-            click.echo(f"{i}. {point}")
+            lines.append(f"{i}. {point}")
+        click.echo("\n".join(lines))
         
         # Generate voice if requested
         if generate_voice:
@@ -132,14 +129,16 @@ def main(pdf_path, output, duration, api_key, generate_voice, voice_output_dir,
                 )
                 
                 if voice_result['success']:
-                    click.echo("✓ Voice generation completed successfully!")
-                    click.echo(f"Audio files generated: {len(voice_result['audio_files'])}")
-                    click.echo(f"Output directory: {voice_result['output_directory']}")
-                    
-                    click.echo("\nGenerated audio files:")
-                    click.echo("-" * 40)
+                    lines = [
+                        "✓ Voice generation completed successfully!",
+                        f"Audio files generated: {len(voice_result['audio_files'])}",
+                        f"Output directory: {voice_result['output_directory']}",
+                        "\nGenerated audio files:",
+                        "-" * 40,
+                    ]
                     for i, audio_file in enumerate(voice_result['audio_files'], 1):
-                        click.echo(f"{i}. {audio_file}")
+                        lines.append(f"{i}. {audio_file}")
+                    click.echo("\n".join(lines))
                 else:
                     click.echo(f"✗ Voice generation failed: {voice_result['error']}", err=True)
                     
@@ -3,46 +3,116 @@ PDF Text Extraction Module
 Handles extraction of text from PDF files using multiple methods for better accuracy.
 """
 
+import io
+import mmap
+import os
 import pdfplumber
 import PyPDF2
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, Optional
 import logging
+from utils import count_words
 
 logger = logging.getLogger(__name__)
 
+# Documents with fewer pages are extracted in-process; below this the
+# worker start-up cost outweighs the parallel speedup
+_PARALLEL_PAGE_THRESHOLD = 10
+
+# Separator written between the text of consecutive pages
+_PAGE_SEP = '\n\n'
+
+# Most recently used PDFs whose metadata is kept per extractor
+_META_CACHE_SIZE = 128
+
+# Strategies accepted by PDFExtractor.extract_text
+EXTRACTION_ENGINES = ('auto', 'fast', 'accurate')
+
+# Quality bar for accepting PyPDF2 output in 'auto' mode
+_QUALITY_SAMPLE_CHARS = 10000
+_MIN_READABLE_RATIO = 0.9
+_MIN_WORDS_PER_PAGE = 20
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text from pages [start, stop) with pdfplumber (runs in a worker process)."""
+    page_texts = [""] * (stop - start)
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, stop + 1))) as pdf:
+        for index, page in enumerate(pdf.pages):
+            try:
+                page_texts[index] = page.extract_text() or ""
+            except Exception as e:
+                logger.warning(f"Error extracting text from page {start + index + 1}: {str(e)}")
+            finally:
+                # Drop the parsed layout objects once the page text is taken
+                page.flush_cache()
+    return page_texts
+
 
 class PDFExtractor:
     """Extract text from PDF files using multiple extraction methods."""
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the extractor.
+        
+        Args:
+            max_workers (int): Worker processes for pdfplumber extraction of
+                large documents (default: number of CPUs)
+        """
         self.extraction_methods = ['pdfplumber', 'PyPDF2']
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Document metadata (e.g. {'pages': n}) recorded during extraction,
+        # keyed by PDF path in LRU order
+        self._meta = OrderedDict()
     
-    def extract_text(self, pdf_path: str) -> str:
+    def extract_text(self, pdf_path: str, engine: str = 'auto') -> str:
         """
         Extract text from PDF file using the best available method.
         
         Args:
             pdf_path (str): Path to the PDF file
+            engine (str): Extraction strategy:
+                'auto' tries the fast PyPDF2 extractor first and falls back to
+                pdfplumber when its output looks incomplete or garbled;
+                'fast' prefers PyPDF2 whenever it yields meaningful text;
+                'accurate' prefers pdfplumber (better for complex layouts)
             
         Returns:
             str: Extracted text content
             
         Raises:
             FileNotFoundError: If PDF file doesn't exist
+            ValueError: If engine is not one of EXTRACTION_ENGINES
             Exception: If extraction fails
         """
+        if engine not in EXTRACTION_ENGINES:
+            raise ValueError(f"Unknown extraction engine '{engine}', expected one of {EXTRACTION_ENGINES}")
+        
         try:
-            # Try pdfplumber first (better for complex layouts)
-            text = self._extract_with_pdfplumber(pdf_path)
-            if text and len(text.strip()) > 100:  # Minimum content check
-                logger.info(f"Successfully extracted text using pdfplumber from {pdf_path}")
+            extractors = [('PyPDF2', self._extract_with_pypdf2), ('pdfplumber', self._extract_with_pdfplumber)]
+            if engine == 'accurate':
+                extractors.reverse()
+            
+            fallback_text = ""
+            for method, extract in extractors:
+                text = extract(pdf_path)
+                if not text or len(text.strip()) <= 100:  # Minimum content check
+                    continue
+                
+                if engine == 'auto' and method == 'PyPDF2' and not self._looks_complete(text, pdf_path):
+                    logger.info("PyPDF2 output looks incomplete, retrying with pdfplumber")
+                    fallback_text = text
+                    continue
+                
+                logger.info(f"Successfully extracted text using {method} from {pdf_path}")
                 return text
             
-            # Fallback to PyPDF2
-            text = self._extract_with_pypdf2(pdf_path)
-            if text and len(text.strip()) > 100:
+            if fallback_text:
                 logger.info(f"Successfully extracted text using PyPDF2 from {pdf_path}")
-                return text
+                return fallback_text
             
             raise Exception("Failed to extract meaningful text from PDF")
             
@@ -50,54 +120,115 @@ class PDFExtractor:
             logger.error(f"Error extracting text from {pdf_path}: {str(e)}")
             raise
     
+    def _looks_complete(self, text: str, pdf_path: str) -> bool:
+        """Cheap check that extracted text is mostly readable and covers every page."""
+        sample = text[:_QUALITY_SAMPLE_CHARS]
+        readable = sum(1 for ch in sample if (ch.isprintable() or ch.isspace()) and ch != '\ufffd')
+        if readable < _MIN_READABLE_RATIO * len(sample):
+            return False
+        
+        page_count = self._meta.get(pdf_path, {}).get('pages') or 1
+        return count_words(text) >= _MIN_WORDS_PER_PAGE * page_count
+    
     def _extract_with_pdfplumber(self, pdf_path: str) -> str:
         """Extract text using pdfplumber library."""
         try:
-            text_content = []
+            buffer = io.StringIO()
             with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content.append(page_text)
-                    except Exception as e:
-                        logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
-                        continue
+                page_count = len(pdf.pages)
+                self._remember_meta(pdf_path, pages=page_count)
+                parallel = page_count >= _PARALLEL_PAGE_THRESHOLD and self.max_workers > 1
+                if not parallel:
+                    for page_num, page in enumerate(pdf.pages, 1):
+                        try:
+                            self._append_page_text(buffer, page.extract_text())
+                        except Exception as e:
+                            logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
+                            continue
+                        finally:
+                            # Drop the parsed layout objects once the page text is taken
+                            page.flush_cache()
+            
+            if parallel:
+                for page_text in self._extract_pages_parallel(pdf_path, page_count):
+                    self._append_page_text(buffer, page_text)
             
-            return '\n\n'.join(text_content)
+            return buffer.getvalue()
         except Exception as e:
             logger.warning(f"pdfplumber extraction failed: {str(e)}")
             return ""
     
+    @staticmethod
+    def _append_page_text(buffer: io.StringIO, page_text: Optional[str]):
+        """Append a non-empty page's text to the buffer, separating pages by a blank line."""
+        if page_text:
+            if buffer.tell():
+                buffer.write(_PAGE_SEP)
+            buffer.write(page_text)
+    
+    def _extract_pages_parallel(self, pdf_path: str, page_count: int) -> List[str]:
+        """Extract pdfplumber page texts across worker processes, in page order."""
+        workers = min(self.max_workers, page_count)
+        # One contiguous page range per worker so each process parses the
+        # document structure only once
+        step = -(-page_count // workers)
+        starts = list(range(0, page_count, step))
+        stops = [min(start + step, page_count) for start in starts]
+        
+        page_texts = [""] * page_count
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_extract_page_range, repeat(pdf_path), starts, stops)
+            for start, range_texts in zip(starts, results):
+                page_texts[start:start + len(range_texts)] = range_texts
+        
+        logger.info(f"Extracted {page_count} pages using {workers} worker processes")
+        return page_texts
+    
     def _extract_with_pypdf2(self, pdf_path: str) -> str:
         """Extract text using PyPDF2 library."""
         try:
-            text_content = []
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            buffer = io.StringIO()
+            # Map the file read-only so PyPDF2 seeks within the page cache
+            # instead of copying the whole PDF into Python buffers
+            with open(pdf_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                pdf_reader = PyPDF2.PdfReader(mapped)
+                self._remember_meta(pdf_path, pages=len(pdf_reader.pages))
                 for page_num, page in enumerate(pdf_reader.pages, 1):
                     try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_content.append(page_text)
+                        self._append_page_text(buffer, page.extract_text())
                     except Exception as e:
                         logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
                         continue
             
-            return '\n\n'.join(text_content)
+            return buffer.getvalue()
         except Exception as e:
             logger.warning(f"PyPDF2 extraction failed: {str(e)}")
             return ""
     
+    def _remember_meta(self, pdf_path: str, **fields):
+        """Record document metadata, evicting the least recently used entry when full."""
+        self._meta.setdefault(pdf_path, {}).update(fields)
+        self._meta.move_to_end(pdf_path)
+        if len(self._meta) > _META_CACHE_SIZE:
+            self._meta.popitem(last=False)
+    
     def get_page_count(self, pdf_path: str) -> int:
         """Get the number of pages in the PDF."""
+        if pdf_path in self._meta:
+            self._meta.move_to_end(pdf_path)
+            return self._meta[pdf_path]['pages']
+        
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                return len(pdf.pages)
+                page_count = len(pdf.pages)
         except Exception:
             try:
                 with open(pdf_path, 'rb') as file:
                     pdf_reader = PyPDF2.PdfReader(file)
-                    return len(pdf_reader.pages)
+                    page_count = len(pdf_reader.pages)
             except Exception:
                 return 0
+        
+        self._remember_meta(pdf_path, pages=page_count)
+        return page_count
@@ -9,16 +9,10 @@ import sys
 import logging
 from pathlib import Path
 from summary_tool import SummaryTool
+from utils import count_words, configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('summary_tool.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging (written by a background thread)
+configure_logging('summary_tool.log')
 
 logger = logging.getLogger(__name__)
 
@@ -63,33 +57,36 @@ def summarize_pdf(pdf_path, output, duration, api_key, verbose):
         
         result = summary_tool.process_pdf(pdf_path, output, duration)
         
-        # Display results
-        click.echo("\n" + "="*60)
-        click.echo("SUMMARY COMPLETED SUCCESSFULLY!")
-        click.echo("="*60)
-        click.echo(f"Source PDF: {result['pdf_path']}")
-        click.echo(f"Pages processed: {result['pdf_page_count']}")
-        click.echo(f"Original words: {result['original_word_count']}")
-        click.echo(f"Summary words: {result['word_count']}")
-        click.echo(f"Estimated duration: {result['estimated_duration_minutes']} minutes")
-        click.echo(f"Summarization method: {result.get('summarization_method', 'openai').upper()}")
-        click.echo(f"Summary saved to: {output}")
+        # Display results as one block so the terminal is written once
+        lines = [
+            "\n" + "="*60,
+            "SUMMARY COMPLETED SUCCESSFULLY!",
+            "="*60,
+            f"Source PDF: {result['pdf_path']}",
+            f"Pages processed: {result['pdf_page_count']}",
+            f"Original words: {result['original_word_count']}",
+            f"Summary words: {result['word_count']}",
+            f"Estimated duration: {result['estimated_duration_minutes']} minutes",
+            f"Summarization method: {result.get('summarization_method', 'openai').upper()}",
+            f"Summary saved to: {output}",
+        ]
         
         # Display summary stats
         stats = summary_tool.get_summary_stats(result)
-        click.echo(f"\nCompression ratio: {stats['compression_ratio']}:1")
-        click.echo(f"Key points: {stats['key_points_count']}")
-        click.echo(f"Key topics: {stats['key_topics_count']}")
+        lines.append(f"\nCompression ratio: {stats['compression_ratio']}:1")
+        lines.append(f"Key points: {stats['key_points_count']}")
+        lines.append(f"Key topics: {stats['key_topics_count']}")
         
-        click.echo("\nSUMMARY PREVIEW:")
-        click.echo("-" * 40)
+        lines.append("\nSUMMARY PREVIEW:")
+        lines.append("-" * 40)
         preview = result['summary'][:500] + "..." if len(result['summary']) > 500 else result['summary']
-        click.echo(preview)
+        lines.append(preview)
         
-        click.echo("\nKEY POINTS:")
-        click.echo("-" * 40)
+        lines.append("\nKEY POINTS:")
+        lines.append("-" * 40)
         for i, point in enumerate(result['key_points'], 1):
-            click.echo(f"{i}. {point}")
+            lines.append(f"{i}. {point}")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -129,37 +126,41 @@ def summarize_text(text, output, duration, api_key, verbose):
             output = f"text_summary_{duration}min.txt"
         
         # Process text
-        click.echo(f"Processing text ({len(text.split())} words)")
+        word_count = count_words(text)
+        click.echo(f"Processing text ({word_count} words)")
         click.echo(f"Target duration: {duration} minutes")
         click.echo("Creating summary...")
         
-        result = summary_tool.summarize_text(text, duration, output)
+        result = summary_tool.summarize_text(text, duration, output, word_count=word_count)
         
-        # Display results
-        click.echo("\n" + "="*60)
-        click.echo("SUMMARY COMPLETED SUCCESSFULLY!")
-        click.echo("="*60)
-        click.echo(f"Original words: {result['original_word_count']}")
-        click.echo(f"Summary words: {result['word_count']}")
-        click.echo(f"Estimated duration: {result['estimated_duration_minutes']} minutes")
-        click.echo(f"Summarization method: {result.get('summarization_method', 'openai').upper()}")
-        click.echo(f"Summary saved to: {output}")
+        # Display results as one block so the terminal is written once
+        lines = [
+            "\n" + "="*60,
+            "SUMMARY COMPLETED SUCCESSFULLY!",
+            "="*60,
+            f"Original words: {result['original_word_count']}",
+            f"Summary words: {result['word_count']}",
+            f"Estimated duration: {result['estimated_duration_minutes']} minutes",
+            f"Summarization method: {result.get('summarization_method', 'openai').upper()}",
+            f"Summary saved to: {output}",
+        ]
         
         # Display summary stats
         stats = summary_tool.get_summary_stats(result)
-        click.echo(f"\nCompression ratio: {stats['compression_ratio']}:1")
-        click.echo(f"Key points: {stats['key_points_count']}")
-        click.echo(f"Key topics: {stats['key_topics_count']}")
+        lines.append(f"\nCompression ratio: {stats['compression_ratio']}:1")
+        lines.append(f"Key points: {stats['key_points_count']}")
+        lines.append(f"Key topics: {stats['key_topics_count']}")
         
-        click.echo("\nSUMMARY PREVIEW:")
-        click.echo("-" * 40)
+        lines.append("\nSUMMARY PREVIEW:")
+        lines.append("-" * 40)
         preview = result['summary'][:500] + "..." if len(result['summary']) > 500 else result['summary']
-        click.echo(preview)
+        lines.append(preview)
         
-        click.echo("\nKEY POINTS:")
-        click.echo("-" * 40)
+        lines.append("\nKEY POINTS:")
+        lines.append("-" * 40)
         for i, point in enumerate(result['key_points'], 1):
-            click.echo(f"{i}. {point}")
+            lines.append(f"{i}. {point}")
+        click.echo("\n".join(lines))
         
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -4,27 +4,61 @@ Handles PDF text extraction and summarization using OpenAI.
 """
 
 import os
+import re
+import hashlib
 import logging
+from collections import Counter
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime
 from pdf_extractor import PDFExtractor
-from text_summarizer import TextSummarizer
+from text_summarizer import TextSummarizer, PROMPT_VERSION
+from config import (MIN_TEXT_LENGTH, ERROR_FORMATTERS, SUCCESS_FORMATTERS,
+                    OPENAI_MAP_MODEL, OPENAI_REDUCE_MODEL, SUMMARY_CACHE_DIR)
+from utils import hash_file, dumps_json, loads_json, count_words
 
 logger = logging.getLogger(__name__)
 
+# Extracted-text normalization: lines that are only a page number
+# ("12", "Page 3", "3 of 10"), runs of inline whitespace and extra blank lines
+_PAGE_NUMBER_LINE_RE = re.compile(r'(?:page\s+)?\d+(?:\s*(?:of|/)\s*\d+)?', re.IGNORECASE)
+_INLINE_WHITESPACE_RE = re.compile(r'[ \t\f\v]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# A line repeated on more than this share of pages is treated as a running
+# header/footer; only applied to documents with at least _MIN_BOILERPLATE_PAGES
+_BOILERPLATE_PAGE_RATIO = 0.3
+_MIN_BOILERPLATE_PAGES = 3
+
 
 class SummaryTool:
     """Tool for PDF text extraction and summarization."""
     
-    def __init__(self, openai_api_key: str = None):
+    def __init__(self, openai_api_key: str = None, cache_dir: str = SUMMARY_CACHE_DIR,
+                 map_model: str = OPENAI_MAP_MODEL, reduce_model: str = OPENAI_REDUCE_MODEL,
+                 use_batch_api: bool = False):
         """
         Initialize the summary tool.
         
         Args:
             openai_api_key (str): OpenAI API key (optional, can use environment variable)
+            cache_dir (str): Directory for cached PDF summaries (None disables caching)
+            map_model (str): OpenAI model for per-chunk summaries of long documents
+            reduce_model (str): OpenAI model for the final summary
+            use_batch_api (bool): Summarize long documents through the cheaper,
+                slower OpenAI Batch API
         """
-        self.pdf_extractor = PDFExtractor()
-        self.text_summarizer = TextSummarizer(api_key=openai_api_key)
+        self.text_summarizer = TextSummarizer(
+            api_key=openai_api_key, map_model=map_model, reduce_model=reduce_model,
+            use_batch_api=use_batch_api
+        )
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+    
+    @cached_property
+    def pdf_extractor(self) -> PDFExtractor:
+        """PDF extractor, created on first use and reused for every PDF this tool processes."""
+        return PDFExtractor()
     
     def process_pdf(self, pdf_path: str, output_path: str = None, duration_minutes: int = 15) -> dict:
         """
@@ -41,49 +75,63 @@ class SummaryTool:
         try:
             # Validate input file
             if not os.path.exists(pdf_path):
-                raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+                raise FileNotFoundError(ERROR_FORMATTERS['file_not_found'](file_path=pdf_path))
             
             if not pdf_path.lower().endswith('.pdf'):
-                raise ValueError("File must be a PDF document")
+                raise ValueError(ERROR_FORMATTERS['invalid_file_type']())
             
             logger.info(f"Processing PDF: {pdf_path}")
             
-            # Extract text from PDF
-            logger.info("Extracting text from PDF...")
-            extracted_text = self.pdf_extractor.extract_text(pdf_path)
-            
-            if not extracted_text or len(extracted_text.strip()) < 100:
-                raise ValueError("Insufficient text extracted from PDF")
-            
-            logger.info(f"Extracted {len(extracted_text.split())} words from PDF")
+            cache_path = self._get_cache_path(pdf_path, duration_minutes)
+            summary_result = self._load_cached_summary(cache_path)
             
-            # Get PDF metadata
-            page_count = self.pdf_extractor.get_page_count(pdf_path)
-            
-            # Create summary
-            logger.info("Creating summary...")
-            summary_result = self.text_summarizer.summarize_for_video(
-                extracted_text, 
-                duration_minutes
-            )
+            if summary_result is None:
+                # Extract text from PDF
+                logger.info("Extracting text from PDF...")
+                extracted_text = self.pdf_extractor.extract_text(pdf_path)
+                
+                if not extracted_text or len(extracted_text.strip()) < MIN_TEXT_LENGTH:
+                    raise ValueError(ERROR_FORMATTERS['insufficient_text'](min_length=MIN_TEXT_LENGTH))
+                
+                logger.info(f"Extracted {count_words(extracted_text)} words from PDF")
+                
+                # Get PDF metadata
+                page_count = self.pdf_extractor.get_page_count(pdf_path)
+                
+                # Drop page furniture so it is not sent to OpenAI
+                extracted_text = self._normalize_text(extracted_text, page_count)
+                
+                # Create summary
+                logger.info("Creating summary...")
+                with self._stream_to_partial(output_path) as on_delta:
+                    summary_result = self.text_summarizer.summarize_for_video(
+                        extracted_text, 
+                        duration_minutes,
+                        on_delta=on_delta
+                    )
+                summary_result['pdf_page_count'] = page_count
+                
+                self._store_cached_summary(cache_path, summary_result)
+            else:
+                logger.info(f"Using cached summary for {pdf_path}")
             
             # Add metadata
             summary_result['pdf_path'] = pdf_path
-            summary_result['pdf_page_count'] = page_count
             summary_result['processed_at'] = datetime.now().isoformat()
             
             # Save to file if output path provided
             if output_path:
                 self._save_summary(summary_result, output_path)
             
-            logger.info("PDF processing completed successfully")
+            logger.info(SUCCESS_FORMATTERS['processing_complete']())
             return summary_result
             
         except Exception as e:
             logger.error(f"Error processing PDF: {str(e)}")
             raise
     
-    def summarize_text(self, text: str, duration_minutes: int = 15, output_path: str = None) -> dict:
+    def summarize_text(self, text: str, duration_minutes: int = 15, output_path: str = None,
+                       word_count: int = None) -> dict:
         """
         Summarize text content directly.
         
@@ -91,15 +139,21 @@ class SummaryTool:
             text (str): Text content to summarize
             duration_minutes (int): Target video duration in minutes
             output_path (str): Path to save the summary (optional)
+            word_count (int): Word count of text, if the caller already has it
             
         Returns:
             dict: Summary results
         """
         try:
-            logger.info(f"Summarizing text ({len(text.split())} words)")
+            if word_count is None:
+                word_count = count_words(text)
+            logger.info(f"Summarizing text ({word_count} words)")
             
             # Create summary
-            summary_result = self.text_summarizer.summarize_for_video(text, duration_minutes)
+            with self._stream_to_partial(output_path) as on_delta:
+                summary_result = self.text_summarizer.summarize_for_video(
+                    text, duration_minutes, original_word_count=word_count, on_delta=on_delta
+                )
             
             # Add metadata
             summary_result['processed_at'] = datetime.now().isoformat()
@@ -116,52 +170,147 @@ class SummaryTool:
             logger.error(f"Error summarizing text: {str(e)}")
             raise
     
+    def _normalize_text(self, text: str, page_count: int) -> str:
+        """Strip page numbers, running headers/footers and redundant whitespace from extracted text."""
+        lines = [_INLINE_WHITESPACE_RE.sub(' ', line).strip() for line in text.split('\n')]
+        
+        boilerplate = set()
+        if page_count >= _MIN_BOILERPLATE_PAGES:
+            threshold = max(2, page_count * _BOILERPLATE_PAGE_RATIO)
+            line_counts = Counter(line for line in lines if line)
+            boilerplate = {line for line, count in line_counts.items() if count > threshold}
+        
+        kept = [
+            line for line in lines
+            if line not in boilerplate and not _PAGE_NUMBER_LINE_RE.fullmatch(line)
+        ]
+        normalized = _BLANK_LINES_RE.sub('\n\n', '\n'.join(kept)).strip()
+        
+        logger.debug(f"Normalized extracted text from {len(text)} to {len(normalized)} characters")
+        return normalized
+    
+    @contextmanager
+    def _stream_to_partial(self, output_path: str = None):
+        """
+        Write summary text to ``<output_path>.partial`` while OpenAI generates it.
+        
+        Yields the callback to pass as ``on_delta`` (None when there is no
+        output path). The partial file is removed once generation ends; the
+        complete summary is then written by _save_summary.
+        """
+        if not output_path:
+            yield None
+            return
+        
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        partial_path = f"{output_path}.partial"
+        try:
+            # Line buffered so the file can be followed while the summary streams
+            with open(partial_path, 'w', encoding='utf-8', buffering=1) as f:
+                yield f.write
+        finally:
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
+    
     def _save_summary(self, summary_result: dict, output_path: str):
         """Save summary result to file."""
         try:
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save as text file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("PDF TEXT SUMMARIZER - VIDEO READY SUMMARY\n")
-                f.write("=" * 50 + "\n\n")
-                
-                f.write(f"Source: {summary_result.get('pdf_path', 'Text Input')}\n")
-                f.write(f"Pages: {summary_result.get('pdf_page_count', 'N/A')}\n")
-                f.write(f"Original Word Count: {summary_result['original_word_count']}\n")
-                f.write(f"Summary Word Count: {summary_result['word_count']}\n")
-                f.write(f"Target Duration: {summary_result['estimated_duration_minutes']} minutes\n")
-                f.write(f"Processed: {summary_result['processed_at']}\n\n")
+            parts = [
+                "PDF TEXT SUMMARIZER - VIDEO READY SUMMARY\n",
+                "=" * 50 + "\n\n",
                 
-                f.write("SUMMARY\n")
-                f.write("-" * 20 + "\n")
-                f.write(summary_result['summary'] + "\n\n")
+                f"Source: {summary_result.get('pdf_path', 'Text Input')}\n",
+                f"Pages: {summary_result.get('pdf_page_count', 'N/A')}\n",
+                f"Original Word Count: {summary_result['original_word_count']}\n",
+                f"Summary Word Count: {summary_result['word_count']}\n",
+                f"Target Duration: {summary_result['estimated_duration_minutes']} minutes\n",
+                f"Processed: {summary_result['processed_at']}\n\n",
                 
-                f.write("KEY POINTS\n")
-                f.write("-" * 20 + "\n")
-                for i, point in enumerate(summary_result['key_points'], 1):
-                    f.write(f"{i}. {point}\n")
-                f.write("\n")
+                "SUMMARY\n",
+                "-" * 20 + "\n",
+                summary_result['summary'] + "\n\n",
                 
-                f.write("KEY TOPICS\n")
-                f.write("-" * 20 + "\n")
-                for topic, count in summary_result['key_topics']:
-                    f.write(f"• {topic} (mentioned {count} times)\n")
-                f.write("\n")
-                
-                if summary_result['reading_metrics']:
-                    f.write("READING METRICS\n")
-                    f.write("-" * 20 + "\n")
-                    for metric, value in summary_result['reading_metrics'].items():
-                        f.write(f"• {metric.replace('_', ' ').title()}: {value:.2f}\n")
+                "KEY POINTS\n",
+                "-" * 20 + "\n",
+            ]
+            parts.extend(f"{i}. {point}\n" for i, point in enumerate(summary_result['key_points'], 1))
+            parts.append("\n")
+            
+            parts.append("KEY TOPICS\n")
+            parts.append("-" * 20 + "\n")
+            parts.extend(f"• {topic} (mentioned {count} times)\n" for topic, count in summary_result['key_topics'])
+            parts.append("\n")
+            
+            if summary_result['reading_metrics']:
+                parts.append("READING METRICS\n")
+                parts.append("-" * 20 + "\n")
+                parts.extend(
+                    f"• {metric.replace('_', ' ').title()}: {value:.2f}\n"
+                    for metric, value in summary_result['reading_metrics'].items()
+                )
+            
+            # Save as text file in a single write, replacing the target atomically
+            tmp_path = f"{output_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
+            os.replace(tmp_path, output_path)
+            
+            # Machine-readable copy of the full result next to the text file
+            json_path = Path(output_path).with_suffix('.json')
+            if json_path == Path(output_path):
+                json_path = Path(f"{output_path}.json")
+            json_tmp_path = Path(f"{json_path}.tmp")
+            json_tmp_path.write_bytes(dumps_json(summary_result, indent=True))
+            os.replace(json_tmp_path, json_path)
             
-            logger.info(f"Summary saved to: {output_path}")
+            logger.info(SUCCESS_FORMATTERS['summary_saved'](output_path=output_path))
             
         except Exception as e:
             logger.error(f"Error saving summary: {str(e)}")
             raise
     
+    def _get_cache_path(self, pdf_path: str, duration_minutes: int):
+        """Return the cache file for a PDF summary, or None when caching is disabled."""
+        if not self.cache_dir:
+            return None
+        
+        try:
+            key = (f"{hash_file(pdf_path)}:{duration_minutes}:{self.text_summarizer.map_model}:"
+                   f"{self.text_summarizer.reduce_model}:{PROMPT_VERSION}")
+        except OSError as e:
+            logger.warning(f"Could not hash {pdf_path} for the summary cache: {str(e)}")
+            return None
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+    
+    def _load_cached_summary(self, cache_path):
+        """Load a cached summary result, returning None on a miss."""
+        if not cache_path or not cache_path.exists():
+            return None
+        
+        try:
+            return loads_json(cache_path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable summary cache entry {cache_path}: {str(e)}")
+            return None
+    
+    def _store_cached_summary(self, cache_path, summary_result: dict):
+        """Write a summary result to the cache; failures only log a warning."""
+        if not cache_path:
+            return
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(dumps_json(summary_result))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write summary cache entry {cache_path}: {str(e)}")
+    
     def set_openai_api_key(self, api_key: str):
         """Set OpenAI API key."""
         self.text_summarizer.set_api_key(api_key)
@@ -0,0 +1,68 @@
+"""Tests for TextSummarizer chunking."""
+
+import pytest
+
+from config import MAX_CHUNK_LENGTH, MAX_CHUNK_TOKENS, MIN_TAIL_CHUNK_FRACTION
+from text_summarizer import TextSummarizer
+
+
+class FakeEncoding:
+    """One token per word; every word after the first carries its leading space."""
+    
+    def encode(self, text):
+        words = text.split()
+        return [(' ' if i else '') + word for i, word in enumerate(words)]
+    
+    def decode(self, ids):
+        return ''.join(ids)
+    
+    def decode_single_token_bytes(self, token):
+        return token.encode()
+
+
+def make_text(word_count):
+    return ' '.join(f"word{i % 10}" for i in range(word_count))
+
+
+def split(text, by_tokens):
+    summarizer = TextSummarizer.__new__(TextSummarizer)
+    if by_tokens:
+        return summarizer._split_text_by_tokens(text, FakeEncoding(), MAX_CHUNK_TOKENS)
+    return summarizer._split_text_into_chunks(text, MAX_CHUNK_LENGTH)
+
+
+def size(chunk, by_tokens):
+    return len(chunk.split()) if by_tokens else len(chunk)
+
+
+@pytest.mark.parametrize("by_tokens", [False, True])
+def test_short_tail_is_merged_into_previous_chunk(by_tokens):
+    # Enough words for two full chunks and a small remainder, in either unit
+    text = make_text(2 * MAX_CHUNK_TOKENS + 100 if by_tokens else 2 * MAX_CHUNK_LENGTH // 6 + 100)
+    
+    chunks = split(text, by_tokens)
+    
+    budget = MAX_CHUNK_TOKENS if by_tokens else MAX_CHUNK_LENGTH
+    assert len(chunks) == 2
+    assert size(chunks[0], by_tokens) <= budget
+    assert size(chunks[1], by_tokens) <= budget * (1 + MIN_TAIL_CHUNK_FRACTION)
+    assert ' '.join(chunks) == text
+
+
+@pytest.mark.parametrize("by_tokens", [False, True])
+def test_substantial_tail_keeps_its_own_chunk(by_tokens):
+    text = make_text(MAX_CHUNK_TOKENS * 3 // 2 if by_tokens else MAX_CHUNK_LENGTH // 4)
+    
+    chunks = split(text, by_tokens)
+    
+    budget = MAX_CHUNK_TOKENS if by_tokens else MAX_CHUNK_LENGTH
+    assert len(chunks) == 2
+    assert all(size(chunk, by_tokens) <= budget for chunk in chunks)
+    assert ' '.join(chunks) == text
+
+
+@pytest.mark.parametrize("by_tokens", [False, True])
+def test_text_within_budget_is_one_chunk(by_tokens):
+    text = make_text(100)
+    
+    assert split(text, by_tokens) == [text]
@@ -0,0 +1,105 @@
+"""Tests for VoiceGenerator output files."""
+
+import json
+
+import pytest
+
+from voice_generator import VoiceGenerator
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response."""
+    
+    def __init__(self, content: bytes, content_type: str = "application/json"):
+        self.status_code = 200
+        self.content = content
+        self.text = content.decode('utf-8')
+        self.headers = {'Content-Type': content_type}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    def iter_content(self, chunk_size=1):
+        yield self.content
+
+
+class FakeSession:
+    """Answers every synthesis request with an audio URL that names its text."""
+    
+    def post(self, url, data, **kwargs):
+        text = json.loads(data)['input_text']
+        return FakeResponse(json.dumps({'audio_url': f"https://cdn.example/{text[0]}"}).encode())
+    
+    def get(self, url, **kwargs):
+        return FakeResponse(f"audio of {url[-1]}".encode(), content_type="audio/mpeg")
+
+
+def write_summary(path, letters):
+    # Paragraphs of 900 characters each become a section of their own
+    path.write_text("\n\n".join(letter * 900 for letter in letters), encoding='utf-8')
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_rerun_does_not_overwrite_linked_duplicate_sections(tmp_path, use_cache):
+    generator = VoiceGenerator(
+        token="token", app_id="app",
+        cache_dir=str(tmp_path / "cache") if use_cache else None
+    )
+    generator._session = FakeSession()
+    output_dir = tmp_path / "audio"
+    summary_file = tmp_path / "summary.txt"
+    
+    # Sections 1 and 3 repeat, so section 3 is linked to section 1's file
+    write_summary(summary_file, "ABA")
+    first = generator.generate_voice_from_file(str(summary_file), output_dir=str(output_dir))
+    assert len(first['audio_files']) == 3
+    
+    # Rerun into the same directory with a different third section
+    write_summary(summary_file, "ABC")
+    second = generator.generate_voice_from_file(str(summary_file), output_dir=str(output_dir))
+    
+    contents = [open(audio_file, 'rb').read() for audio_file in second['audio_files']]
+    assert contents == [b"audio of A", b"audio of B", b"audio of C"]
+
+
+class FakeBatchSession(FakeSession):
+    """Accepts batch requests and records the first letter of every text sent for synthesis."""
+    
+    def __init__(self):
+        self.synthesized = []
+    
+    def post(self, url, data, **kwargs):
+        payload = json.loads(data)
+        if 'inputs' not in payload:
+            self.synthesized.append(payload['input_text'][0])
+            return super().post(url, data, **kwargs)
+        texts = [item['input_text'] for item in payload['inputs']]
+        self.synthesized.extend(text[0] for text in texts)
+        urls = [f"https://cdn.example/{text[0]}" for text in texts]
+        return FakeResponse(json.dumps({'audio_urls': urls}).encode())
+
+
+def test_batch_requests_only_synthesize_uncached_texts(tmp_path):
+    generator = VoiceGenerator(
+        token="token", app_id="app", batch_requests=True, cache_dir=str(tmp_path / "cache")
+    )
+    session = generator._session = FakeBatchSession()
+    summary_file = tmp_path / "summary.txt"
+    
+    write_summary(summary_file, "AB")
+    generator.generate_voice_from_file(str(summary_file), output_dir=str(tmp_path / "first"))
+    assert session.synthesized == ["A", "B"]
+    
+    # A and B come from the cache; only the new sections go into the batch
+    write_summary(summary_file, "ABCD")
+    result = generator.generate_voice_from_file(str(summary_file), output_dir=str(tmp_path / "second"))
+    
+    assert session.synthesized == ["A", "B", "C", "D"]
+    contents = [open(audio_file, 'rb').read() for audio_file in result['audio_files']]
+    assert contents == [b"audio of A", b"audio of B", b"audio of C", b"audio of D"]
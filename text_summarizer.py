@@ -4,36 +4,231 @@ Optimized for creating summaries suitable for 15-minute video content.
 """
 
 import re
-import nltk
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
-from typing import List, Dict, Tuple
-from openai import OpenAI
-import textstat
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from openai import OpenAI, AsyncOpenAI, RateLimitError
 import logging
 from dotenv import load_dotenv
 
+try:
+    import tiktoken
+except ImportError:  # Optional; chunks are then sized by characters
+    tiktoken = None
+from config import (MAX_CHUNK_LENGTH, MAX_CHUNK_TOKENS, MIN_TAIL_CHUNK_FRACTION,
+                    OPENAI_MAX_CONCURRENCY, OPENAI_MAP_MODEL, OPENAI_REDUCE_MODEL,
+                    OPENAI_RATE_LIMIT_RETRIES, OPENAI_BACKOFF_SECONDS, OPENAI_BATCH_MIN_CHUNKS,
+                    OPENAI_BATCH_POLL_SECONDS, OPENAI_BATCH_MAX_POLL_SECONDS,
+                    OPENAI_MAX_REQUESTS_PER_MINUTE, OPENAI_MAX_TOKENS_PER_MINUTE)
+from utils import count_words, dumps_json, loads_json, split_words_into_chunks
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Stable instructions sent at the start of every chunk request. Only the user
+# message varies between calls, so the prompt prefix stays byte-identical and
+# OpenAI's automatic prompt caching can reuse it.
+SUMMARY_SYSTEM_PROMPT = """You are an expert content creator who specializes in creating video-ready summaries. Your summaries are engaging, clear, and optimized for spoken presentation.
+
+When asked to summarize text for a video presentation, write a comprehensive summary that:
+
+1. Captures all main concepts and key findings
+2. Is engaging and suitable for spoken presentation
+3. Includes important details while remaining concise
+4. Flows naturally for video narration
+5. Highlights the most significant points
+
+Keep to the requested length and provide a well-structured summary that works as a video script."""
+
+SHORTEN_SYSTEM_PROMPT = "You are an expert at creating concise, video-ready summaries."
+
+# Bump whenever the prompts above change so cached summaries are not reused
+PROMPT_VERSION = 3
+
+# Common words excluded from key topics
+_STOP_WORDS = frozenset({
+    'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said',
+    'each', 'which', 'their', 'time', 'would', 'there', 'could', 'other', 'after',
+    'first', 'well', 'also', 'new', 'want', 'because', 'any', 'these', 'give', 'day',
+    'most', 'us', 'is', 'are', 'was', 'be', 'being', 'has', 'had', 'do', 'does', 'did',
+    'should', 'may', 'might', 'must', 'can', 'shall'
+})
+
+# Text cleanup patterns, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_PDF_ARTIFACT_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\']')
+_TRAILING_NUMBER_RE = re.compile(r'\b\d+\b(?=\s*$)', re.MULTILINE)
+
+# Common section markers
+_SECTION_PATTERNS = (
+    re.compile(r'\n\s*\d+\.\s+[A-Z][^.\n]*', re.MULTILINE),  # Numbered sections
+    re.compile(r'\n\s*[A-Z][A-Z\s]+:', re.MULTILINE),  # ALL CAPS headers
+    re.compile(r'\n\s*[A-Z][^.\n]*\n(?=[A-Z])', re.MULTILINE),  # Title case headers
+)
+
+_TOPIC_WORD_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+_SENTENCE_RE = re.compile(r'[^.!?]+')
+
+# Sync OpenAI clients shared by every TextSummarizer with the same API key,
+# so their HTTP connection pools (and kept-alive connections) are reused
+_CLIENTS: Dict[str, OpenAI] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_openai_client(api_key: str) -> OpenAI:
+    """Return the shared OpenAI client for api_key, creating it on first use."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = OpenAI(api_key=api_key)
+        return client
+
+
+# How many tokens back from a window end to look for the start of a word
+_TOKEN_BOUNDARY_LOOKBACK = 32
+
+
+@lru_cache(maxsize=None)
+def _get_token_encoding(model: str):
+    """Return the tiktoken encoding for model, or None when it cannot be loaded."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        # Encodings are fetched on first use, which fails offline
+        logger.warning(f"Could not load tiktoken encoding for {model}: {str(e)}")
+        return None
+
+
+# textstat readability scores reported in reading_metrics, in order
+_READING_METRICS = (
+    'flesch_reading_ease',
+    'flesch_kincaid_grade',
+    'automated_readability_index',
+    'coleman_liau_index',
+)
+
+
+@lru_cache(maxsize=128)
+def _reading_metric_scores(text: str) -> Tuple[float, ...]:
+    """Compute the _READING_METRICS scores for text; memoized per text."""
+    # Imported on first use: textstat and its hyphenation data are slow to load
+    import textstat
+    return tuple(getattr(textstat, metric)(text) for metric in _READING_METRICS)
+
+
+class RateLimiter:
+    """Token buckets that hold OpenAI calls back before they would exceed RPM/TPM limits."""
+    
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        """
+        Initialize the limiter with full buckets.
+        
+        Args:
+            max_requests_per_minute (float): Requests allowed per minute
+            max_tokens_per_minute (float): Tokens (prompt plus completion) allowed per minute
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._available_requests = float(max_requests_per_minute)
+        self._available_tokens = float(max_tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Take capacity for one request if it is there; otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            self._available_requests = min(
+                self.max_requests_per_minute,
+                self._available_requests + elapsed * self.max_requests_per_minute / 60
+            )
+            self._available_tokens = min(
+                self.max_tokens_per_minute,
+                self._available_tokens + elapsed * self.max_tokens_per_minute / 60
+            )
+            
+            # A request larger than the whole bucket waits for a full bucket
+            tokens = min(estimated_tokens, self.max_tokens_per_minute)
+            if self._available_requests >= 1 and self._available_tokens >= tokens:
+                self._available_requests -= 1
+                self._available_tokens -= tokens
+                return 0.0
+            
+            return max(
+                (1 - self._available_requests) * 60 / self.max_requests_per_minute,
+                (tokens - self._available_tokens) * 60 / self.max_tokens_per_minute
+            )
+    
+    def acquire(self, estimated_tokens: int):
+        """Block until a request of estimated_tokens fits within the limits."""
+        while True:
+            wait = self._reserve(estimated_tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self, estimated_tokens: int):
+        """Wait, without blocking the event loop, until a request of estimated_tokens fits."""
+        while True:
+            wait = self._reserve(estimated_tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+    
+    @staticmethod
+    def estimate_tokens(request: Dict) -> int:
+        """Rough token cost of a chat request: prompt characters / 4 plus its max_tokens."""
+        prompt_chars = sum(len(message['content']) for message in request['messages'])
+        return prompt_chars // 4 + request.get('max_tokens', 0)
+
 
 class TextSummarizer:
     """Summarize text content using OpenAI API, optimized for 15-minute video format."""
     
-    def __init__(self, api_key: str = None):
-        self._download_nltk_data()
+    def __init__(self, api_key: str = None, map_model: str = OPENAI_MAP_MODEL,
+                 reduce_model: str = OPENAI_REDUCE_MODEL, max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+                 use_batch_api: bool = False, batch_min_chunks: int = OPENAI_BATCH_MIN_CHUNKS,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the summarizer.
+        
+        Args:
+            api_key (str): OpenAI API key (optional, can use environment variable)
+            map_model (str): Model for the per-chunk summaries of multi-chunk texts
+            reduce_model (str): Model for single-chunk summaries and the final shortening pass
+            max_concurrency (int): Maximum chunk requests in flight at once
+            use_batch_api (bool): Summarize long texts through the OpenAI Batch API,
+                which costs less but may take up to 24 hours
+            batch_min_chunks (int): Minimum chunk count for the Batch API path
+            rate_limiter (RateLimiter): Limiter applied before every chat completion
+                (default: one sized by OPENAI_MAX_REQUESTS/TOKENS_PER_MINUTE)
+        """
+        self.map_model = map_model
+        self.reduce_model = reduce_model
+        self.max_concurrency = max(1, max_concurrency)
+        self.use_batch_api = use_batch_api
+        self.batch_min_chunks = batch_min_chunks
+        self.rate_limiter = rate_limiter or RateLimiter(
+            OPENAI_MAX_REQUESTS_PER_MINUTE, OPENAI_MAX_TOKENS_PER_MINUTE
+        )
         self._initialize_openai_client(api_key)
     
-    def _download_nltk_data(self):
-        """Download required NLTK data."""
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-        except Exception as e:
-            logger.warning(f"Could not download NLTK data: {str(e)}")
-    
     def _initialize_openai_client(self, api_key: str = None):
         """Initialize OpenAI client."""
         try:
@@ -46,20 +241,29 @@ class TextSummarizer:
             if not self.api_key:
                 raise ValueError("OpenAI API key is required. Please set OPENAI_API_KEY environment variable or pass api_key parameter.")
             
-            self.openai_client = OpenAI(api_key=self.api_key)
+            self.openai_client = _get_openai_client(self.api_key)
             logger.info("OpenAI client initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {str(e)}")
             raise
     
-    def summarize_for_video(self, text: str, target_duration_minutes: int = 15) -> Dict[str, any]:
+    def summarize_for_video(self, text: str, target_duration_minutes: int = 15,
+                            original_word_count: int = None,
+                            on_delta: Optional[Callable[[str], None]] = None,
+                            compute_reading_metrics: bool = True) -> Dict[str, any]:
         """
         Create a summary optimized for video content of specified duration using OpenAI.
         
         Args:
             text (str): Input text to summarize
             target_duration_minutes (int): Target video duration in minutes
+            original_word_count (int): Word count of text, if the caller already has it
+            on_delta (callable): Called with each piece of summary text as OpenAI
+                streams it (optional). A draft that is later shortened is
+                followed by the shortened text, so treat it as progress output.
+            compute_reading_metrics (bool): Score the summary's readability; when
+                False, reading_metrics is empty and textstat is never loaded
             
         Returns:
             Dict containing summary, key points, and metadata
@@ -71,12 +275,27 @@ class TextSummarizer:
             # Calculate target word count based on speaking rate
             target_word_count = self._calculate_target_word_count(target_duration_minutes)
             
-            # Extract key sections and topics
-            sections = self._extract_sections(cleaned_text)
-            key_topics = self._extract_key_topics(cleaned_text)
-            
-            # Create summary using OpenAI
-            summary = self._create_openai_summary(cleaned_text, target_word_count, target_duration_minutes)
+            # Create summary using OpenAI in the background; it is network-bound,
+            # so the local analysis below runs while the requests are in flight
+            executor = ThreadPoolExecutor(max_workers=1)
+            summary_future = executor.submit(
+                self._create_openai_summary, cleaned_text, target_word_count, target_duration_minutes,
+                on_delta
+            )
+            try:
+                # Extract key sections and topics
+                sections = self._extract_sections(cleaned_text)
+                key_topics = self._extract_key_topics(cleaned_text)
+                
+                summary = summary_future.result()
+            except Exception:
+                # Fail now instead of waiting for OpenAI; a request already in
+                # flight cannot be cancelled and finishes in the background
+                summary_future.cancel()
+                raise
+            finally:
+                # The summary is done unless something failed, so never block here
+                executor.shutdown(wait=False)
             
             if not summary:
                 raise ValueError("Failed to generate summary using OpenAI")
@@ -85,18 +304,22 @@ class TextSummarizer:
             key_points = self._extract_key_points(cleaned_text, summary)
             
             # Calculate reading metrics
-            reading_metrics = self._calculate_reading_metrics(summary)
+            reading_metrics = self._calculate_reading_metrics(summary) if compute_reading_metrics else {}
+            
+            summary_word_count = count_words(summary)
+            if original_word_count is None:
+                original_word_count = count_words(text)
             
             return {
                 'summary': summary,
                 'key_points': key_points,
                 'key_topics': key_topics,
                 'sections': sections,
-                'word_count': len(summary.split()),
+                'word_count': summary_word_count,
                 'target_word_count': target_word_count,
-                'estimated_duration_minutes': self._estimate_reading_time(summary),
+                'estimated_duration_minutes': self._estimate_reading_time(summary_word_count),
                 'reading_metrics': reading_metrics,
-                'original_word_count': len(text.split()),
+                'original_word_count': original_word_count,
                 'summarization_method': 'openai'
             }
             
@@ -107,13 +330,13 @@ class TextSummarizer:
     def _clean_text(self, text: str) -> str:
         """Clean and preprocess text."""
         # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove common PDF artifacts
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)\[\]\"\']', '', text)
+        text = _PDF_ARTIFACT_RE.sub('', text)
         
         # Remove page numbers and headers/footers
-        text = re.sub(r'\b\d+\b(?=\s*$)', '', text, flags=re.MULTILINE)
+        text = _TRAILING_NUMBER_RE.sub('', text)
         
         return text.strip()
     
@@ -128,16 +351,14 @@ class TextSummarizer:
         """Extract main sections from the text."""
         sections = []
         
-        # Split by common section markers
-        section_patterns = [
-            r'\n\s*\d+\.\s+[A-Z][^.\n]*',  # Numbered sections
-            r'\n\s*[A-Z][A-Z\s]+:',  # ALL CAPS headers
-            r'\n\s*[A-Z][^.\n]*\n(?=[A-Z])',  # Title case headers
-        ]
+        # Every section marker starts at a line break; _clean_text collapses
+        # them, so cleaned text needs no pattern scans at all
+        if '\n' not in text:
+            return sections
         
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE)
-            for match in matches:
+        # Split by common section markers
+        for pattern in _SECTION_PATTERNS:
+            for match in pattern.finditer(text):
                 sections.append({
                     'title': match.group().strip(),
                     'position': match.start()
@@ -148,69 +369,69 @@ class TextSummarizer:
     def _extract_key_topics(self, text: str) -> List[str]:
         """Extract key topics from the text."""
         # Simple keyword extraction based on frequency and importance
-        words = re.findall(r'\b[A-Za-z]{4,}\b', text.lower())
+        words = _TOPIC_WORD_RE.findall(text)
         
-        # Remove common stop words
-        stop_words = {'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'would', 'there', 'could', 'other', 'after', 'first', 'well', 'also', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'shall'}
-        
-        word_freq = {}
-        for word in words:
-            if word not in stop_words and len(word) > 3:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        # Count every word in one pass, then drop the stop words from the
+        # (much smaller) vocabulary instead of testing each occurrence.
+        # Lowercasing per word avoids a lowercased copy of the whole text.
+        word_freq = Counter(map(str.lower, words))
+        for word in _STOP_WORDS:
+            word_freq.pop(word, None)
         
         # Return top 10 most frequent words
-        return sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+        return word_freq.most_common(10)
     
-    def _create_openai_summary(self, text: str, target_word_count: int, duration_minutes: int) -> str:
+    def _create_openai_summary(self, text: str, target_word_count: int, duration_minutes: int,
+                               on_delta: Optional[Callable[[str], None]] = None) -> str:
         """Create summary using OpenAI API."""
         try:
-            # Split text into chunks if too long (OpenAI has token limits)
-            max_chunk_length = 12000  # Conservative limit for GPT-3.5-turbo
-            chunks = self._split_text_into_chunks(text, max_chunk_length)
-            
-            summaries = []
+            # Split text into chunks if too long (OpenAI has token limits);
+            # measure tokens exactly when tiktoken is available
+            encoding = _get_token_encoding(self.map_model)
+            if encoding is not None:
+                chunks = self._split_text_by_tokens(text, encoding, MAX_CHUNK_TOKENS)
+            else:
+                chunks = self._split_text_into_chunks(text, MAX_CHUNK_LENGTH)
             
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Processing chunk {i+1}/{len(chunks)} with OpenAI")
-                
-                # Create prompt for video-optimized summary
-                prompt = self._create_summary_prompt(chunk, target_word_count, duration_minutes)
-                
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are an expert content creator who specializes in creating video-ready summaries. Your summaries are engaging, clear, and optimized for spoken presentation."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=min(1000, target_word_count * 1.5),  # Allow some flexibility
-                    temperature=0.3,  # Lower temperature for more consistent summaries
-                    top_p=0.9
+            if len(chunks) == 1:
+                logger.info("Processing chunk 1/1 with OpenAI")
+                # A lone chunk is the final summary, so it gets the reduce model
+                summaries = [self._complete(
+                    self._create_chunk_request(chunks[0], target_word_count, duration_minutes,
+                                               self.reduce_model),
+                    on_delta
+                )]
+            elif self.use_batch_api and len(chunks) >= self.batch_min_chunks:
+                summaries = self._summarize_chunks_batch(chunks, target_word_count, duration_minutes)
+                if on_delta:
+                    on_delta(' '.join(summaries))
+            else:
+                # Chunk requests are independent, so run them concurrently
+                summaries = asyncio.run(
+                    self._summarize_chunks_async(chunks, target_word_count, duration_minutes, on_delta)
                 )
-                
-                chunk_summary = response.choices[0].message.content.strip()
-                summaries.append(chunk_summary)
             
             # Combine summaries
             combined_summary = ' '.join(summaries)
             
             # If combined summary is too long, ask OpenAI to shorten it
-            if len(combined_summary.split()) > target_word_count * 1.2:
+            if count_words(combined_summary) > target_word_count * 1.2:
                 logger.info("Summary too long, requesting shorter version from OpenAI")
                 shorten_prompt = f"""Please shorten this summary to approximately {target_word_count} words while maintaining all key information and making it suitable for a {duration_minutes}-minute video presentation:
 
 {combined_summary}"""
                 
-                response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {"role": "system", "content": "You are an expert at creating concise, video-ready summaries."},
+                if on_delta:
+                    on_delta("\n\n")
+                combined_summary = self._complete({
+                    'model': self.reduce_model,
+                    'messages': [
+                        {"role": "system", "content": SHORTEN_SYSTEM_PROMPT},
                         {"role": "user", "content": shorten_prompt}
                     ],
-                    max_tokens=target_word_count + 200,
-                    temperature=0.3
-                )
-                
-                combined_summary = response.choices[0].message.content.strip()
+                    'max_tokens': target_word_count + 200,
+                    'temperature': 0.3
+                }, on_delta)
             
             return combined_summary
             
@@ -218,75 +439,214 @@ class TextSummarizer:
             logger.error(f"OpenAI summarization failed: {str(e)}")
             raise
     
+    def _complete(self, request: Dict, on_delta: Optional[Callable[[str], None]] = None) -> str:
+        """Run a chat completion, streaming the reply to on_delta when given."""
+        self.rate_limiter.acquire(RateLimiter.estimate_tokens(request))
+        if on_delta is None:
+            response = self.openai_client.chat.completions.create(**request)
+            return response.choices[0].message.content.strip()
+        
+        pieces = []
+        for chunk in self.openai_client.chat.completions.create(**request, stream=True):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                pieces.append(delta)
+                on_delta(delta)
+        return ''.join(pieces).strip()
+    
+    def _create_chunk_request(self, chunk: str, target_word_count: int, duration_minutes: int,
+                              model: str) -> Dict:
+        """Build the chat completion arguments for summarizing one chunk."""
+        # Create prompt for video-optimized summary
+        prompt = self._create_summary_prompt(chunk, target_word_count, duration_minutes)
+        
+        return {
+            'model': model,
+            'messages': [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': int(min(1000, target_word_count * 1.5)),  # Allow some flexibility
+            'temperature': 0.3,  # Lower temperature for more consistent summaries
+            'top_p': 0.9
+        }
+    
+    async def _summarize_chunks_async(self, chunks: List[str], target_word_count: int,
+                                      duration_minutes: int,
+                                      on_delta: Optional[Callable[[str], None]] = None) -> List[str]:
+        """
+        Summarize chunks concurrently, at most max_concurrency requests at a time.
+        
+        Replies are streamed, and each chunk summary is passed to on_delta (when
+        given) as soon as it and every chunk before it are done.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # The async client's connection pool is tied to the running event loop,
+        # so it lives only as long as this call
+        client = AsyncOpenAI(api_key=self.api_key)
+        
+        async def complete(request: Dict, label: str) -> str:
+            for attempt in range(OPENAI_RATE_LIMIT_RETRIES + 1):
+                try:
+                    async with semaphore:
+                        await self.rate_limiter.acquire_async(RateLimiter.estimate_tokens(request))
+                        logger.info(f"Processing {label} with OpenAI")
+                        stream = await client.chat.completions.create(**request, stream=True)
+                        pieces = []
+                        async for chunk in stream:
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                pieces.append(chunk.choices[0].delta.content)
+                    return ''.join(pieces)
+                except RateLimitError:
+                    if attempt == OPENAI_RATE_LIMIT_RETRIES:
+                        raise
+                    # Exponential backoff with jitter so throttled chunks do not
+                    # retry in lockstep; the semaphore is released while waiting
+                    delay = OPENAI_BACKOFF_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5)
+                    logger.warning(f"Rate limited on {label}, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+        
+        results = [None] * len(chunks)
+        emitted = 0
+        
+        async def summarize_chunk(index: int, chunk: str):
+            nonlocal emitted
+            request = self._create_chunk_request(chunk, target_word_count, duration_minutes,
+                                                 self.map_model)
+            results[index] = (await complete(request, f"chunk {index + 1}/{len(chunks)}")).strip()
+            # Hand finished summaries downstream in document order
+            while emitted < len(chunks) and results[emitted] is not None:
+                if on_delta:
+                    on_delta((' ' if emitted else '') + results[emitted])
+                emitted += 1
+        
+        try:
+            await asyncio.gather(*(summarize_chunk(i, chunk) for i, chunk in enumerate(chunks)))
+            return results
+        finally:
+            await client.close()
+    
+    def _summarize_chunks_batch(self, chunks: List[str], target_word_count: int,
+                                duration_minutes: int) -> List[str]:
+        """Summarize chunks through the OpenAI Batch API, blocking until the batch finishes."""
+        if not hasattr(self.openai_client, 'batches'):
+            raise RuntimeError(
+                "The OpenAI Batch API needs openai>=1.18.0; upgrade the openai package "
+                "or create the summarizer with use_batch_api=False"
+            )
+        
+        requests_jsonl = b"\n".join(
+            dumps_json({
+                'custom_id': f"chunk-{index}",
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._create_chunk_request(chunk, target_word_count, duration_minutes,
+                                                   self.map_model)
+            })
+            for index, chunk in enumerate(chunks)
+        )
+        
+        batch_file = self.openai_client.files.create(
+            file=("summary_chunks.jsonl", requests_jsonl), purpose="batch"
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted {len(chunks)} chunks as OpenAI batch {batch.id}")
+        
+        delay = OPENAI_BATCH_POLL_SECONDS
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(delay)
+            delay = min(delay * 2, OPENAI_BATCH_MAX_POLL_SECONDS)
+            batch = self.openai_client.batches.retrieve(batch.id)
+            logger.debug(f"OpenAI batch {batch.id} status: {batch.status}")
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+        
+        # Results arrive in arbitrary order; custom_id maps them back to their chunk
+        summaries = [None] * len(chunks)
+        for line in self.openai_client.files.content(batch.output_file_id).read().splitlines():
+            if not line.strip():
+                continue
+            record = loads_json(line)
+            response = record.get('response') or {}
+            if record.get('error') or response.get('status_code') != 200:
+                continue
+            index = int(record['custom_id'].split('-', 1)[1])
+            summaries[index] = response['body']['choices'][0]['message']['content'].strip()
+        
+        missing = [index + 1 for index, summary in enumerate(summaries) if summary is None]
+        if missing:
+            raise RuntimeError(f"OpenAI batch {batch.id} returned no summary for chunks {missing}")
+        return summaries
+    
     def _create_summary_prompt(self, text: str, target_word_count: int, duration_minutes: int) -> str:
-        """Create a prompt for OpenAI summarization."""
-        return f"""Please create a comprehensive summary of the following text that is optimized for a {duration_minutes}-minute video presentation. The summary should be approximately {target_word_count} words and should:
-
-1. Capture all main concepts and key findings
-2. Be engaging and suitable for spoken presentation
-3. Include important details while remaining concise
-4. Flow naturally for video narration
-5. Highlight the most significant points
+        """Create the per-chunk user prompt; standing instructions live in SUMMARY_SYSTEM_PROMPT."""
+        return f"""Summarize the following text for a {duration_minutes}-minute video presentation in approximately {target_word_count} words.
 
 Text to summarize:
-{text}
-
-Please provide a well-structured summary that would work perfectly for a {duration_minutes}-minute video script."""
+{text}"""
     
-    def _split_text_into_chunks(self, text: str, max_length: int) -> List[str]:
-        """Split text into chunks that fit within token limits."""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
+    def _split_text_by_tokens(self, text: str, encoding, max_tokens: int) -> List[str]:
+        """
+        Split text into chunks of at most max_tokens tokens, cutting between words.
         
-        for word in words:
-            if current_length + len(word) + 1 > max_length and current_chunk:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-            else:
-                current_chunk.append(word)
-                current_length += len(word) + 1
+        Every chunk but the last is filled, so a last chunk under
+        MIN_TAIL_CHUNK_FRACTION of max_tokens is merged into the one before it
+        rather than costing a request of its own.
+        """
+        ids = encoding.encode(text)
+        boundaries = [0]
         
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        while boundaries[-1] < len(ids):
+            start = boundaries[-1]
+            end = min(start + max_tokens, len(ids))
+            if end < len(ids):
+                # Move the cut back to a token that begins a new word, if one is near
+                for cut in range(end, max(start + 1, end - _TOKEN_BOUNDARY_LOOKBACK), -1):
+                    if encoding.decode_single_token_bytes(ids[cut])[:1].isspace():
+                        end = cut
+                        break
+            boundaries.append(end)
         
+        if len(boundaries) > 2 and boundaries[-1] - boundaries[-2] < max_tokens * MIN_TAIL_CHUNK_FRACTION:
+            del boundaries[-2]
+        chunks = (encoding.decode(ids[a:b]).strip() for a, b in zip(boundaries, boundaries[1:]))
+        return [chunk for chunk in chunks if chunk]
+    
+    def _split_text_into_chunks(self, text: str, max_length: int) -> List[str]:
+        """Split text into chunks of at most max_length characters, merging a short last chunk."""
+        chunks = split_words_into_chunks(text, max_length)
+        # Same tail rule as _split_text_by_tokens, measured in characters
+        if len(chunks) > 1 and len(chunks[-1]) < max_length * MIN_TAIL_CHUNK_FRACTION:
+            chunks[-2:] = [f"{chunks[-2]} {chunks[-1]}"]
         return chunks
     
     def _extract_key_points(self, original_text: str, summary: str) -> List[str]:
         """Extract key points for visual presentation."""
-        # Extract sentences that contain important information
-        sentences = re.split(r'[.!?]+', summary)
-        key_points = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20 and len(sentence) < 100:  # Good length for key points
-                # Check if sentence contains important keywords
-                important_words = ['important', 'key', 'main', 'primary', 'essential', 'critical', 'significant', 'major', 'core', 'fundamental']
-                if any(word in sentence.lower() for word in important_words):
-                    key_points.append(sentence)
-                elif len(key_points) < 5:  # Limit to 5 key points
-                    key_points.append(sentence)
-        
-        return key_points[:5]
+        # The first five sentences of a good length for key points; scanning
+        # stops as soon as they are found
+        sentences = (match.group().strip() for match in _SENTENCE_RE.finditer(summary))
+        return list(islice((sentence for sentence in sentences if 20 < len(sentence) < 100), 5))
     
     def _calculate_reading_metrics(self, text: str) -> Dict[str, float]:
         """Calculate reading difficulty metrics."""
         try:
-            return {
-                'flesch_reading_ease': textstat.flesch_reading_ease(text),
-                'flesch_kincaid_grade': textstat.flesch_kincaid_grade(text),
-                'automated_readability_index': textstat.automated_readability_index(text),
-                'coleman_liau_index': textstat.coleman_liau_index(text)
-            }
+            return dict(zip(_READING_METRICS, _reading_metric_scores(text)))
         except Exception:
             return {}
     
-    def _estimate_reading_time(self, text: str) -> float:
-        """Estimate reading time in minutes."""
-        word_count = len(text.split())
+    def _estimate_reading_time(self, text_or_word_count: Union[str, int]) -> float:
+        """Estimate reading time in minutes from text or an already computed word count."""
+        if isinstance(text_or_word_count, int):
+            word_count = text_or_word_count
+        else:
+            word_count = count_words(text_or_word_count)
         words_per_minute = 155  # Average speaking rate
         return round(word_count / words_per_minute, 1)
     
@@ -2,14 +2,120 @@
 Utility functions for PDF Text Summarizer
 """
 
+import atexit
+from bisect import bisect_right
+import hashlib
+from itertools import accumulate
+import json
+import mmap
 import os
+import queue
 import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\S+')
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_DIGIT_RE = re.compile(r'\d')
+_URL_RE = re.compile(r'http[s]?://')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+
+def configure_logging(log_file: str, level: int = logging.INFO) -> QueueListener:
+    """
+    Configure root logging to a file and stdout without blocking the caller.
+    
+    Records are queued and written by a background listener thread, which
+    is stopped (flushing the queue) at interpreter exit.
+    
+    Args:
+        log_file (str): Path of the log file
+        level (int): Root logging level
+        
+    Returns:
+        QueueListener: The started listener
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Only merge the message here; the listener's handlers apply the full format
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    if hasattr(os, 'register_at_fork'):
+        def _log_directly_in_child():
+            # The listener thread does not survive fork, so forked workers
+            # write through the real handlers instead of an unread queue
+            root = logging.getLogger()
+            if queue_handler in root.handlers:
+                root.removeHandler(queue_handler)
+                for handler in handlers:
+                    root.addHandler(handler)
+        
+        os.register_at_fork(after_in_child=_log_directly_in_child)
+    
+    return listener
+
+
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words without building a list of them.
+    
+    Args:
+        text (str): Text content
+        
+    Returns:
+        int: Number of words in the text
+    """
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def split_words_into_chunks(text: str, max_length: int) -> List[str]:
+    """
+    Split text between words into chunks of at most max_length characters.
+    
+    Args:
+        text (str): Text content
+        max_length (int): Longest chunk, in characters; a single longer word
+            still forms a chunk of its own
+        
+    Returns:
+        List[str]: Chunks with their words joined by single spaces
+    """
+    words = text.split()
+    # offsets[i] is where word i would start in ' '.join(words), so the
+    # chunk words[a:b] is offsets[b] - offsets[a] - 1 characters long
+    offsets = list(accumulate((len(word) + 1 for word in words), initial=0))
+    
+    boundaries = [0]
+    while boundaries[-1] < len(words):
+        start = boundaries[-1]
+        # Furthest end that keeps the chunk within max_length
+        end = bisect_right(offsets, offsets[start] + max_length + 1, start + 1) - 1
+        boundaries.append(max(end, start + 1))
+    
+    return [' '.join(words[a:b]) for a, b in zip(boundaries, boundaries[1:])]
+
 
 def validate_pdf_file(file_path: str) -> Dict[str, Any]:
     """
@@ -19,7 +125,8 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
         file_path (str): Path to the PDF file
         
     Returns:
-        Dict containing validation results
+        Dict containing validation results; file_info['stat'] holds the
+        os.stat_result so callers need not stat the file again
     """
     validation_result = {
         'is_valid': False,
@@ -29,10 +136,17 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
     }
     
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # A single open yields the file's stat result and its header
+        try:
+            with open(file_path, 'rb') as f:
+                file_stat = os.fstat(f.fileno())
+                header = f.read(4)
+        except FileNotFoundError:
             validation_result['errors'].append(f"File not found: {file_path}")
             return validation_result
+        except OSError as e:
+            validation_result['errors'].append(f"Cannot read file: {str(e)}")
+            return validation_result
         
         # Check file extension
         if not file_path.lower().endswith('.pdf'):
@@ -40,14 +154,14 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
             return validation_result
         
         # Get file info
-        file_stat = os.stat(file_path)
-        file_size_mb = file_stat.st_size / (1024 * 1024)
+        file_size_mb = get_file_size_mb(file_path, file_stat)
         
         validation_result['file_info'] = {
             'size_mb': round(file_size_mb, 2),
             'size_bytes': file_stat.st_size,
             'path': file_path,
-            'name': Path(file_path).name
+            'name': Path(file_path).name,
+            'stat': file_stat
         }
         
         # Check file size
@@ -58,15 +172,9 @@ def validate_pdf_file(file_path: str) -> Dict[str, Any]:
             )
             return validation_result
         
-        # Check if file is readable
-        try:
-            with open(file_path, 'rb') as f:
-                header = f.read(4)
-                if header != b'%PDF':
-                    validation_result['errors'].append("File does not appear to be a valid PDF")
-                    return validation_result
-        except Exception as e:
-            validation_result['errors'].append(f"Cannot read file: {str(e)}")
+        # Check the PDF signature
+        if header != b'%PDF':
+            validation_result['errors'].append("File does not appear to be a valid PDF")
             return validation_result
         
         validation_result['is_valid'] = True
@@ -92,10 +200,10 @@ def clean_filename(filename: str) -> str:
         str: Cleaned filename
     """
     # Remove or replace invalid characters
-    cleaned = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    cleaned = _INVALID_FILENAME_CHARS_RE.sub('_', filename)
     
     # Remove extra spaces and dots
-    cleaned = re.sub(r'\s+', '_', cleaned)
+    cleaned = _WHITESPACE_RE.sub('_', cleaned)
     cleaned = cleaned.strip('._')
     
     # Ensure it's not empty
@@ -118,15 +226,12 @@ def format_duration(minutes: float) -> str:
     if minutes < 1:
         seconds = int(minutes * 60)
         return f"{seconds} seconds"
-    elif minutes < 60:
+    if minutes < 60:
         return f"{minutes:.1f} minutes"
-    else:
-        hours = int(minutes // 60)
-        remaining_minutes = minutes % 60
-        if remaining_minutes > 0:
-            return f"{hours}h {remaining_minutes:.1f}m"
-        else:
-            return f"{hours} hours"
+    hours, remaining_minutes = divmod(minutes, 60)
+    if remaining_minutes:
+        return f"{int(hours)}h {remaining_minutes:.1f}m"
+    return f"{int(hours)} hours"
 
 
 def format_word_count(word_count: int) -> str:
@@ -141,10 +246,9 @@ def format_word_count(word_count: int) -> str:
     """
     if word_count < 1000:
         return f"{word_count} words"
-    elif word_count < 1000000:
-        return f"{word_count/1000:.1f}K words"
-    else:
-        return f"{word_count/1000000:.1f}M words"
+    if word_count < 1000000:
+        return f"{word_count / 1000:.1f}K words"
+    return f"{word_count / 1000000:.1f}M words"
 
 
 def create_output_filename(pdf_path: str, duration_minutes: int = 15) -> str:
@@ -175,23 +279,79 @@ def ensure_output_directory(output_path: str) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
 
-def get_file_size_mb(file_path: str) -> float:
+def get_file_size_mb(file_path: str, stat_result: os.stat_result = None) -> float:
     """
     Get file size in MB.
     
     Args:
         file_path (str): Path to the file
+        stat_result (os.stat_result): Already fetched stat of the file (optional)
         
     Returns:
         float: File size in MB
     """
     try:
-        size_bytes = os.path.getsize(file_path)
+        size_bytes = stat_result.st_size if stat_result is not None else os.path.getsize(file_path)
         return size_bytes / (1024 * 1024)
     except Exception:
         return 0.0
 
 
+def hash_file(file_path: str, chunk_size: int = 64 * 1024) -> str:
+    """
+    Compute the SHA-256 digest of a file without loading it into memory.
+    
+    Args:
+        file_path (str): Path to the file
+        chunk_size (int): Bytes read per iteration when the file cannot be mapped
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        except ValueError:
+            # Empty files cannot be mapped; fall back to buffered reads
+            for block in iter(lambda: f.read(chunk_size), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data (Any): JSON-serializable data
+        indent (bool): Pretty-print with two-space indentation
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        data (bytes): Encoded JSON document
+        
+    Returns:
+        Any: Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def truncate_text(text: str, max_length: int = 500, suffix: str = "...") -> str:
     """
     Truncate text to specified length.
@@ -220,14 +380,19 @@ def extract_metadata_from_text(text: str) -> Dict[str, Any]:
     Returns:
         Dict containing extracted metadata
     """
+    # Splitting on sentence-end runs yields one more piece than there are
+    # runs; count the runs instead of building the list of pieces
+    sentence_count = sum(1 for _ in _SENTENCE_END_RE.finditer(text)) + 1
+    
     metadata = {
-        'word_count': len(text.split()),
+        'word_count': count_words(text),
         'character_count': len(text),
-        'sentence_count': len(re.split(r'[.!?]+', text)),
+        'sentence_count': sentence_count,
         'paragraph_count': len([p for p in text.split('\n\n') if p.strip()]),
-        'has_numbers': bool(re.search(r'\d', text)),
-        'has_urls': bool(re.search(r'http[s]?://', text)),
-        'has_emails': bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text))
+        'has_numbers': bool(_DIGIT_RE.search(text)),
+        # Substring checks rule out most texts before the regex engine runs
+        'has_urls': 'http' in text and bool(_URL_RE.search(text)),
+        'has_emails': '@' in text and bool(_EMAIL_RE.search(text))
     }
     
     return metadata
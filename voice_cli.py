@@ -9,16 +9,11 @@ import sys
 import logging
 from pathlib import Path
 from voice_tool import VoiceTool
+from utils import configure_logging
+from config import VBEE_MAX_CONCURRENCY
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_generator.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging (written by a background thread)
+configure_logging('voice_generator.log')
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +26,11 @@ logger = logging.getLogger(__name__)
 @click.option('--callback-url', '-c', default='', help='Callback URL for async processing (optional)')
 @click.option('--token', help='VBee API token (or set VBEE_TOKEN environment variable)')
 @click.option('--app-id', help='VBee app ID (or set VBEE_APP_ID environment variable)')
+@click.option('--concurrency', default=VBEE_MAX_CONCURRENCY, type=click.IntRange(min=1),
+              help=f'Sections synthesized in parallel (default: {VBEE_MAX_CONCURRENCY})')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def generate_voice(summary_file, output_dir, voice_code, speed_rate, callback_url, token, app_id, verbose):
+def generate_voice(summary_file, output_dir, voice_code, speed_rate, callback_url, token, app_id,
+                   concurrency, verbose):
     """
     Generate voice audio from summary file using VBee TTS API.
     
@@ -44,7 +42,7 @@ def generate_voice(summary_file, output_dir, voice_code, speed_rate, callback_ur
     try:
         # Initialize voice tool
         click.echo("Initializing VBee TTS client...")
-        voice_tool = VoiceTool(vbee_token=token, vbee_app_id=app_id)
+        voice_tool = VoiceTool(vbee_token=token, vbee_app_id=app_id, max_concurrency=concurrency)
         click.echo("✓ VBee TTS client initialized successfully")
         
         # Generate voice
@@ -66,6 +64,8 @@ def generate_voice(summary_file, output_dir, voice_code, speed_rate, callback_ur
             click.echo("="*60)
             click.echo(f"Summary file: {result['summary_file']}")
             click.echo(f"Total sections: {result['total_sections']}")
+            if result['failed_sections']:
+                click.echo(f"Failed sections: {', '.join(map(str, result['failed_sections']))}", err=True)
             click.echo(f"Audio files generated: {len(result['audio_files'])}")
             click.echo(f"Output directory: {result['output_directory']}")
             
@@ -93,8 +93,11 @@ def generate_voice(summary_file, output_dir, voice_code, speed_rate, callback_ur
 @click.option('--callback-url', '-c', default='', help='Callback URL for async processing (optional)')
 @click.option('--token', help='VBee API token (or set VBEE_TOKEN environment variable)')
 @click.option('--app-id', help='VBee app ID (or set VBEE_APP_ID environment variable)')
+@click.option('--concurrency', default=VBEE_MAX_CONCURRENCY, type=click.IntRange(min=1),
+              help=f'Sections synthesized in parallel (default: {VBEE_MAX_CONCURRENCY})')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def generate_voice_from_text(text, output_dir, voice_code, speed_rate, callback_url, token, app_id, verbose):
+def generate_voice_from_text(text, output_dir, voice_code, speed_rate, callback_url, token, app_id,
+                             concurrency, verbose):
     """
     Generate voice audio directly from text using VBee TTS API.
     
@@ -106,7 +109,7 @@ def generate_voice_from_text(text, output_dir, voice_code, speed_rate, callback_
     try:
         # Initialize voice tool
         click.echo("Initializing VBee TTS client...")
-        voice_tool = VoiceTool(vbee_token=token, vbee_app_id=app_id)
+        voice_tool = VoiceTool(vbee_token=token, vbee_app_id=app_id, max_concurrency=concurrency)
         click.echo("✓ VBee TTS client initialized successfully")
         
         # Generate voice
@@ -128,6 +131,8 @@ def generate_voice_from_text(text, output_dir, voice_code, speed_rate, callback_
             click.echo("="*60)
             click.echo(f"Text length: {len(text)} characters")
             click.echo(f"Total chunks: {result['total_chunks']}")
+            if result['failed_chunks']:
+                click.echo(f"Failed chunks: {', '.join(map(str, result['failed_chunks']))}", err=True)
             click.echo(f"Audio files generated: {len(result['audio_files'])}")
             click.echo(f"Output directory: {result['output_directory']}")
             
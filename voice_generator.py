@@ -3,32 +3,110 @@ Voice Generation Module using VBee TTS API
 Converts text summaries to audio files for video creation.
 """
 
-import json
+import asyncio
+import functools
+import hashlib
 import os
+import re
+import shutil
+import threading
 import time
 import logging
-from typing import Dict, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from config import (VBEE_MAX_CONCURRENCY, VBEE_MAX_RETRIES, VBEE_BACKOFF_SECONDS,
+                    VOICE_CACHE_DIR, VOICE_CACHE_MAX_MB)
+from utils import dumps_json, loads_json, split_words_into_chunks
 
 logger = logging.getLogger(__name__)
 
+# Audio downloads are written to disk in pieces of this size as they arrive
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Body of the "SUMMARY" section written by SummaryTool, up to the key points
+_SUMMARY_SECTION_RE = re.compile(r'^SUMMARY\n-+\n(.*?)(?=\n\nKEY POINTS|\Z)', re.MULTILINE | re.DOTALL)
+
+
+@contextmanager
+def _replacing(output_file: str):
+    """
+    Yield a temporary path next to output_file and move it over output_file on success.
+    
+    Repeated sections are hard links to one file, so an output file is always
+    replaced by a new one rather than overwritten in place; writing through a
+    shared inode would change every section linked to it.
+    """
+    tmp_path = f"{output_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, output_file)
+    finally:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+
 
 class VoiceGenerator:
     """Generate voice audio from text using VBee TTS API."""
     
-    def __init__(self, token: str = None, app_id: str = None):
+    __slots__ = (
+        'token', 'app_id', 'base_url', 'timeout', 'max_concurrency', 'batch_requests',
+        'cache_dir', 'stream_audio', '_batch_supported', '_credentials_rejected', '_session',
+        '_headers', '_stream_headers', '_payload_template'
+    )
+    
+    def __init__(self, token: str = None, app_id: str = None,
+                 max_concurrency: int = VBEE_MAX_CONCURRENCY, batch_requests: bool = False,
+                 cache_dir: str = VOICE_CACHE_DIR, stream_audio: bool = False):
         """
         Initialize voice generator with VBee TTS credentials.
         
         Args:
             token (str): VBee API token
             app_id (str): VBee application ID
+            max_concurrency (int): Sections synthesized in parallel
+            batch_requests (bool): Try sending all sections in one API call first
+                (only for VBee endpoints that accept an "inputs" list)
+            cache_dir (str): Directory for cached section audio (None disables caching)
+            stream_audio (bool): Ask VBee for the audio itself and write it to disk as it
+                is synthesized; JSON replies with an audio URL are still handled
         """
         self.token = token or os.getenv('VBEE_TOKEN')
         self.app_id = app_id or os.getenv('VBEE_APP_ID')
         self.base_url = "https://vbee.vn/api/v1/tts"
         self.timeout = 120  # 2 minutes timeout
+        self.max_concurrency = max_concurrency
+        self.batch_requests = batch_requests
+        self._batch_supported = None  # Learned from the first batch call
+        self._credentials_rejected = False  # Set by a 401/403 so later sections are skipped
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.stream_audio = stream_audio
+        
+        # One pooled session so sections reuse TCP/TLS connections instead of
+        # paying a new handshake per request; the pool matches the worker count.
+        # Rate limiting (429) and transient server errors are retried with
+        # exponential backoff, honouring Retry-After; the final response is
+        # returned rather than raised so it is reported like any other error
+        self._session = requests.Session()
+        retry = Retry(
+            total=VBEE_MAX_RETRIES,
+            backoff_factor=VBEE_BACKOFF_SECONDS,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST", "GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_concurrency, pool_maxsize=max_concurrency, max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        self._set_request_defaults()
         
         if not self.token:
             raise ValueError("VBee token is required. Set VBEE_TOKEN environment variable or pass token parameter.")
@@ -59,19 +137,15 @@ class VoiceGenerator:
             sections = self._extract_text_sections(summary_text)
             
             # Generate voice for each section
-            audio_files = []
-            for i, section in enumerate(sections):
-                logger.info(f"Generating voice for section {i+1}/{len(sections)}")
-                audio_file = self._generate_section_voice(
-                    section, i+1, output_dir, voice_code, speed_rate, callback_url
-                )
-                if audio_file:
-                    audio_files.append(audio_file)
+            audio_files, failed_sections = self._generate_all(
+                "section", sections, output_dir, voice_code, speed_rate, callback_url
+            )
             
             return {
                 'success': True,
                 'audio_files': audio_files,
                 'total_sections': len(sections),
+                'failed_sections': failed_sections,
                 'summary_file': summary_file_path,
                 'output_directory': output_dir or os.path.dirname(summary_file_path)
             }
@@ -82,7 +156,8 @@ class VoiceGenerator:
                 'success': False,
                 'error': str(e),
                 'audio_files': [],
-                'total_sections': 0
+                'total_sections': 0,
+                'failed_sections': []
             }
     
     def generate_voice_from_text(self, text: str, output_dir: str = None,
@@ -105,19 +180,15 @@ class VoiceGenerator:
             # Split text into manageable chunks
             chunks = self._split_text_into_chunks(text, max_length=1000)
             
-            audio_files = []
-            for i, chunk in enumerate(chunks):
-                logger.info(f"Generating voice for chunk {i+1}/{len(chunks)}")
-                audio_file = self._generate_chunk_voice(
-                    chunk, i+1, output_dir, voice_code, speed_rate, callback_url
-                )
-                if audio_file:
-                    audio_files.append(audio_file)
+            audio_files, failed_chunks = self._generate_all(
+                "chunk", chunks, output_dir, voice_code, speed_rate, callback_url
+            )
             
             return {
                 'success': True,
                 'audio_files': audio_files,
                 'total_chunks': len(chunks),
+                'failed_chunks': failed_chunks,
                 'output_directory': output_dir or '.'
             }
             
@@ -127,29 +198,190 @@ class VoiceGenerator:
                 'success': False,
                 'error': str(e),
                 'audio_files': [],
-                'total_chunks': 0
+                'total_chunks': 0,
+                'failed_chunks': []
             }
     
+    async def generate_voice_from_file_async(self, summary_file_path: str, **kwargs) -> Dict[str, any]:
+        """
+        Awaitable generate_voice_from_file for callers running an event loop.
+        
+        The blocking HTTP and file work runs in the loop's default executor, so the
+        loop keeps serving other tasks while the sections are synthesized.
+        
+        Args:
+            summary_file_path (str): Path to the summary text file
+            **kwargs: Same keyword arguments as generate_voice_from_file
+            
+        Returns:
+            Dict containing generation results and file paths
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_voice_from_file, summary_file_path, **kwargs)
+        )
+    
+    async def generate_voice_from_text_async(self, text: str, **kwargs) -> Dict[str, any]:
+        """
+        Awaitable generate_voice_from_text for callers running an event loop.
+        
+        Args:
+            text (str): Text to convert to speech
+            **kwargs: Same keyword arguments as generate_voice_from_text
+            
+        Returns:
+            Dict containing generation results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_voice_from_text, text, **kwargs)
+        )
+    
+    def _generate_all(self, label: str, texts: List[str], output_dir: str, voice_code: str,
+                      speed_rate: str, callback_url: str) -> Tuple[List[str], List[int]]:
+        """
+        Synthesize texts in parallel, bounded by max_concurrency.
+        
+        Synthesis requests and audio downloads run on separate thread pools: as soon
+        as a request returns its audio URL, the download is handed to the download
+        pool and the worker moves on to the next request.
+        
+        Args:
+            label (str): Name of a text in log messages and output file names
+            texts (List[str]): Texts to synthesize, in playback order
+            output_dir (str): Directory to save audio files
+            voice_code (str): Voice code for TTS
+            speed_rate (str): Speech speed rate
+            callback_url (str): Callback URL for async processing
+            
+        Returns:
+            Tuple[List[str], List[int]]: Paths of the generated audio files in playback
+            order, and the 1-based indexes of the texts that got no audio
+        """
+        if not texts:
+            logger.warning("No text to synthesize; skipping voice generation")
+            return [], []
+        
+        # Created once here so the per-text workers only write into it
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        # Identical texts are synthesized once, under the index of their first
+        # occurrence; repeats are linked to that file afterwards
+        first_indexes = {}
+        for index, text in enumerate(texts, 1):
+            first_indexes.setdefault(text, index)
+        
+        # Output file (or None on failure) for each unique text, or a Future
+        # while its download is still running
+        results = {}
+        pending = first_indexes
+        audio_urls = None
+        if self.batch_requests and self._batch_supported is not False and len(first_indexes) > 1:
+            # Serve what the cache already holds and batch only the rest
+            pending = {}
+            for text, index in first_indexes.items():
+                output_file = self._audio_file_path(output_dir, label, index)
+                if self._load_cached_audio(self._get_cache_path(text, voice_code, speed_rate), output_file):
+                    logger.info(f"Using cached audio for {label} {index}: {output_file}")
+                    results[text] = output_file
+                else:
+                    pending[text] = index
+            if len(pending) > 1:
+                audio_urls = self._call_vbee_api_batch(list(pending), voice_code, speed_rate, callback_url)
+        
+        def download(index: int, audio_url: str, output_file: str,
+                     cache_path: Optional[Path]) -> Optional[str]:
+            try:
+                self._download_audio_file(audio_url, output_file)
+            except Exception as e:
+                logger.error(f"Error generating voice for {label} {index}: {str(e)}")
+                return None
+            self._store_cached_audio(output_file, cache_path)
+            logger.info(f"Generated audio file: {output_file}")
+            return output_file
+        
+        workers = max(1, min(self.max_concurrency, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers) as download_executor:
+            if audio_urls is not None:
+                for (text, index), audio_url in zip(pending.items(), audio_urls):
+                    results[text] = download_executor.submit(
+                        download, index, audio_url, self._audio_file_path(output_dir, label, index),
+                        self._get_cache_path(text, voice_code, speed_rate)
+                    )
+            elif pending:
+                def synthesize(index: int, text: str):
+                    logger.info(f"Generating voice for {label} {index}/{len(texts)}")
+                    request = self._request_voice(
+                        text, label, index, output_dir, voice_code, speed_rate, callback_url
+                    )
+                    if isinstance(request, tuple):
+                        return download_executor.submit(download, index, *request)
+                    return request
+                
+                # map() keeps the results in submission order
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results.update(zip(pending, executor.map(synthesize, pending.values(), pending)))
+            
+            audio_by_text = {
+                text: result.result() if isinstance(result, Future) else result
+                for text, result in results.items()
+            }
+        
+        if self._credentials_rejected:
+            raise ValueError("VBee rejected the token or app ID; check VBEE_TOKEN and VBEE_APP_ID")
+        
+        audio_files = []
+        failed_indexes = []
+        for index, text in enumerate(texts, 1):
+            audio_file = audio_by_text[text]
+            if audio_file and index != first_indexes[text]:
+                audio_file = self._link_audio_file(
+                    audio_file, self._audio_file_path(output_dir, label, index)
+                )
+            if audio_file:
+                audio_files.append(audio_file)
+            else:
+                failed_indexes.append(index)
+        
+        if failed_indexes:
+            logger.warning(f"No audio for {len(failed_indexes)}/{len(texts)} {label}s: {failed_indexes}")
+        
+        # One scan of the cache per job, after every section has been stored
+        if self.cache_dir:
+            self._evict_cached_audio()
+        
+        return audio_files, failed_indexes
+    
+    @staticmethod
+    def _audio_file_path(output_dir: str, label: str, index: int) -> str:
+        """Return the output file for the index-th section or chunk."""
+        return os.path.join(output_dir or '', f"{label}_{index:02d}.mp3")
+    
+    def _link_audio_file(self, source_file: str, output_file: str) -> Optional[str]:
+        """Give output_file the audio of source_file, by hard link where possible."""
+        try:
+            with _replacing(output_file) as tmp_path:
+                try:
+                    os.link(source_file, tmp_path)
+                except OSError:
+                    shutil.copyfile(source_file, tmp_path)
+        except OSError as e:
+            logger.error(f"Error copying audio file to {output_file}: {str(e)}")
+            return None
+        logger.info(f"Reused audio of {source_file} for {output_file}")
+        return output_file
+    
     def _read_summary_file(self, file_path: str) -> str:
         """Read and parse summary file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Extract the main summary section
-            summary_start = content.find("SUMMARY")
-            if summary_start != -1:
-                summary_section = content[summary_start:]
-                # Find the end of summary (next section or end of file)
-                next_section = summary_section.find("\n\nKEY POINTS")
-                if next_section != -1:
-                    summary_text = summary_section[:next_section]
-                else:
-                    summary_text = summary_section
-                
-                # Clean up the summary text
-                summary_text = summary_text.replace("SUMMARY\n", "").replace("-" * 20, "").strip()
-                return summary_text
+            # Extract the main summary section in one scan
+            match = _SUMMARY_SECTION_RE.search(content)
+            if match:
+                return match.group(1).strip()
             
             # If no SUMMARY section found, return the whole content
             return content
@@ -163,131 +395,177 @@ class VoiceGenerator:
         # Split by paragraphs
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
         
-        # Combine small paragraphs
+        # Combine small paragraphs; current_length counts each paragraph plus
+        # its joining space, so no intermediate strings are built
         sections = []
-        current_section = ""
+        current_parts = []
+        current_length = 0
         
         for paragraph in paragraphs:
-            if len(current_section + paragraph) < 800:  # Keep sections under 800 chars
-                current_section += paragraph + " "
+            paragraph_length = len(paragraph)
+            if current_length + paragraph_length < 800:  # Keep sections under 800 chars
+                current_parts.append(paragraph)
+                current_length += paragraph_length + 1
             else:
-                if current_section:
-                    sections.append(current_section.strip())
-                current_section = paragraph + " "
+                if current_parts:
+                    sections.append(' '.join(current_parts))
+                current_parts = [paragraph]
+                current_length = paragraph_length + 1
         
-        if current_section:
-            sections.append(current_section.strip())
+        if current_parts:
+            sections.append(' '.join(current_parts))
         
         return sections
     
     def _split_text_into_chunks(self, text: str, max_length: int = 1000) -> List[str]:
         """Split text into chunks suitable for TTS."""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for word in words:
-            if current_length + len(word) + 1 > max_length and current_chunk:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_length = len(word)
-            else:
-                current_chunk.append(word)
-                current_length += len(word) + 1
+        return split_words_into_chunks(text, max_length)
+    
+    def _request_voice(self, text: str, label: str, index: int, output_dir: str, voice_code: str,
+                       speed_rate: str, callback_url: str) -> Union[str, Tuple[str, str, Optional[Path]], None]:
+        """
+        Request synthesis of one section or chunk.
         
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        Returns:
+            The output file when served from the cache, (audio_url, output_file,
+            cache_path) when the audio still has to be downloaded, or None on failure
+        """
+        if self._credentials_rejected:
+            return None  # Every further call would be rejected as well
         
-        return chunks
-    
-    def _generate_section_voice(self, text: str, section_num: int, output_dir: str,
-                               voice_code: str, speed_rate: str, callback_url: str) -> Optional[str]:
-        """Generate voice for a single section."""
         try:
-            # Create output filename
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                output_file = os.path.join(output_dir, f"section_{section_num:02d}.mp3")
-            else:
-                output_file = f"section_{section_num:02d}.mp3"
+            # Create output filename; _generate_all has created output_dir
+            output_file = self._audio_file_path(output_dir, label, index)
             
-            # Call VBee TTS API
-            response = self._call_vbee_api(text, voice_code, speed_rate, callback_url)
-            
-            if response and 'audio_url' in response:
-                # Download the audio file
-                audio_url = response['audio_url']
-                self._download_audio_file(audio_url, output_file)
-                logger.info(f"Generated audio file: {output_file}")
+            # Reuse audio synthesized earlier for the same text and voice
+            cache_path = self._get_cache_path(text, voice_code, speed_rate)
+            if self._load_cached_audio(cache_path, output_file):
+                logger.info(f"Using cached audio for {label} {index}: {output_file}")
                 return output_file
-            else:
-                logger.error(f"Failed to generate voice for section {section_num}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error generating voice for section {section_num}: {str(e)}")
-            return None
-    
-    def _generate_chunk_voice(self, text: str, chunk_num: int, output_dir: str,
-                             voice_code: str, speed_rate: str, callback_url: str) -> Optional[str]:
-        """Generate voice for a single chunk."""
-        try:
-            # Create output filename
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                output_file = os.path.join(output_dir, f"chunk_{chunk_num:02d}.mp3")
-            else:
-                output_file = f"chunk_{chunk_num:02d}.mp3"
             
             # Call VBee TTS API
-            response = self._call_vbee_api(text, voice_code, speed_rate, callback_url)
+            response = self._call_vbee_api(
+                text, voice_code, speed_rate, callback_url,
+                output_file if self.stream_audio else None
+            )
             
-            if response and 'audio_url' in response:
-                # Download the audio file
-                audio_url = response['audio_url']
-                self._download_audio_file(audio_url, output_file)
+            if response and 'audio_file' in response:
+                self._store_cached_audio(output_file, cache_path)
                 logger.info(f"Generated audio file: {output_file}")
                 return output_file
+            elif response and 'audio_url' in response:
+                return response['audio_url'], output_file, cache_path
             else:
-                logger.error(f"Failed to generate voice for chunk {chunk_num}")
+                logger.error(f"Failed to generate voice for {label} {index}")
                 return None
                 
         except Exception as e:
-            logger.error(f"Error generating voice for chunk {chunk_num}: {str(e)}")
+            logger.error(f"Error generating voice for {label} {index}: {str(e)}")
             return None
     
-    def _call_vbee_api(self, text: str, voice_code: str, speed_rate: str, callback_url: str) -> Optional[Dict]:
-        """Call VBee TTS API."""
+    def _get_cache_path(self, text: str, voice_code: str, speed_rate: str) -> Optional[Path]:
+        """Return the cache file for a text and voice, or None when caching is disabled."""
+        if not self.cache_dir:
+            return None
+        
+        key = hashlib.sha256(f"{text}|{voice_code}|{speed_rate}".encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.mp3"
+    
+    def _load_cached_audio(self, cache_path: Optional[Path], output_file: str) -> bool:
+        """Copy cached audio to output_file, returning False on a miss."""
+        if not cache_path or not cache_path.exists():
+            return False
+        
+        try:
+            with _replacing(output_file) as tmp_path:
+                shutil.copyfile(cache_path, tmp_path)
+            os.utime(cache_path)  # Mark as recently used for eviction
+            return True
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable voice cache entry {cache_path}: {str(e)}")
+            return False
+    
+    def _store_cached_audio(self, output_file: str, cache_path: Optional[Path]):
+        """Copy generated audio into the cache; failures only log a warning."""
+        if not cache_path:
+            return
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write voice cache entry {cache_path}: {str(e)}")
+    
+    def _evict_cached_audio(self):
+        """Delete least recently used cache entries until the cache fits VOICE_CACHE_MAX_MB."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*/*.mp3'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by a concurrent eviction
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        budget = VOICE_CACHE_MAX_MB * 1024 * 1024
+        for _, size, path in sorted(entries):
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+    
+    def _call_vbee_api(self, text: str, voice_code: str, speed_rate: str, callback_url: str,
+                       output_file: Optional[str] = None) -> Optional[Dict]:
+        """
+        Call VBee TTS API.
+        
+        With output_file, the reply is streamed: audio is written straight to
+        output_file and {'audio_file': output_file} is returned, while a JSON reply
+        is returned as usual.
+        """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.token}"
-            }
-            
             payload = {
+                **self._payload_template,
                 "voice_code": voice_code,
                 "speed_rate": speed_rate,
                 "input_text": text,
-                "app_id": self.app_id,
                 "callback_url": callback_url
             }
             
             logger.info(f"Calling VBee TTS API for text length: {len(text)} characters")
-            response = requests.post(
+            streaming = output_file is not None
+            with self._session.post(
                 self.base_url,
-                headers=headers,
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                logger.info("VBee TTS API call successful")
-                return result
-            else:
-                logger.error(f"VBee TTS API error: {response.status_code} - {response.text}")
-                return None
+                headers=self._stream_headers if streaming else self._headers,
+                data=dumps_json(payload),
+                timeout=self.timeout,
+                stream=streaming
+            ) as response:
+                if response.status_code == 200:
+                    if streaming and response.headers.get('Content-Type', '').startswith('audio/'):
+                        # The first bytes reach disk while the tail is still being synthesized
+                        with _replacing(output_file) as tmp_path, open(tmp_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                        logger.info("VBee TTS API call successful (streamed audio)")
+                        return {'audio_file': output_file}
+                    
+                    result = loads_json(response.content)
+                    logger.info("VBee TTS API call successful")
+                    return result
+                elif response.status_code in (401, 403):
+                    logger.error(f"VBee TTS API rejected the credentials: {response.status_code} - {response.text}")
+                    self._credentials_rejected = True
+                    return None
+                else:
+                    logger.error(f"VBee TTS API error: {response.status_code} - {response.text}")
+                    return None
                 
         except requests.exceptions.Timeout:
             logger.error("VBee TTS API timeout")
@@ -299,14 +577,70 @@ class VoiceGenerator:
             logger.error(f"Unexpected error calling VBee TTS API: {str(e)}")
             return None
     
+    def _call_vbee_api_batch(self, texts: List[str], voice_code: str, speed_rate: str,
+                             callback_url: str) -> Optional[List[str]]:
+        """
+        Request audio for several texts in one VBee API call.
+        
+        Args:
+            texts (List[str]): Texts to synthesize, in playback order
+            voice_code (str): Voice code for TTS
+            speed_rate (str): Speech speed rate
+            callback_url (str): Callback URL for async processing
+            
+        Returns:
+            Optional[List[str]]: One audio URL per text, or None to fall back to
+            one call per text
+        """
+        try:
+            payload = {
+                **self._payload_template,
+                "inputs": [
+                    {"input_text": text, "voice_code": voice_code, "speed_rate": speed_rate}
+                    for text in texts
+                ],
+                "callback_url": callback_url
+            }
+            
+            logger.info(f"Calling VBee TTS API for {len(texts)} texts in one batch")
+            response = self._session.post(
+                self.base_url,
+                headers=self._headers,
+                data=dumps_json(payload),
+                timeout=self.timeout
+            )
+            
+            if response.status_code in (400, 404):
+                # The endpoint does not take batches; stop probing it
+                logger.info("VBee TTS API does not accept batches; using one call per text")
+                self._batch_supported = False
+                return None
+            if response.status_code != 200:
+                logger.error(f"VBee TTS API batch error: {response.status_code} - {response.text}")
+                return None
+            
+            audio_urls = loads_json(response.content).get('audio_urls')
+            if not isinstance(audio_urls, list) or len(audio_urls) != len(texts):
+                logger.info("Unexpected VBee TTS API batch reply; using one call per text")
+                self._batch_supported = False
+                return None
+            
+            self._batch_supported = True
+            return audio_urls
+            
+        except Exception as e:
+            logger.error(f"Error calling VBee TTS API batch: {str(e)}")
+            return None
+    
     def _download_audio_file(self, audio_url: str, output_file: str):
         """Download audio file from URL."""
         try:
-            response = requests.get(audio_url, timeout=60)
-            response.raise_for_status()
-            
-            with open(output_file, 'wb') as f:
-                f.write(response.content)
+            with self._session.get(audio_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                with _replacing(output_file) as tmp_path, open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
             
             logger.info(f"Downloaded audio file: {output_file}")
             
@@ -318,6 +652,17 @@ class VoiceGenerator:
         """Update VBee credentials."""
         self.token = token
         self.app_id = app_id
+        self._credentials_rejected = False
+        self._set_request_defaults()
+    
+    def _set_request_defaults(self):
+        """Build the headers and payload fields shared by every VBee request."""
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.token}"
+        }
+        self._stream_headers = {**self._headers, "Accept": "audio/mpeg, application/json"}
+        self._payload_template = {"app_id": self.app_id}
     
     def get_available_voices(self) -> List[Dict]:
         """Get list of available voices (if API supports it)."""
@@ -7,6 +7,7 @@ import os
 import logging
 from typing import Dict, Optional, List
 from voice_generator import VoiceGenerator
+from config import VBEE_MAX_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +15,21 @@ logger = logging.getLogger(__name__)
 class VoiceTool:
     """Tool for generating voice audio from text using VBee TTS API."""
     
-    def __init__(self, vbee_token: str = None, vbee_app_id: str = None):
+    __slots__ = ('voice_generator',)
+    
+    def __init__(self, vbee_token: str = None, vbee_app_id: str = None,
+                 max_concurrency: int = VBEE_MAX_CONCURRENCY):
         """
         Initialize the voice tool.
         
         Args:
             vbee_token (str): VBee API token (optional, can use environment variable)
             vbee_app_id (str): VBee app ID (optional, can use environment variable)
+            max_concurrency (int): Sections synthesized in parallel
         """
-        self.voice_generator = VoiceGenerator(token=vbee_token, app_id=vbee_app_id)
+        self.voice_generator = VoiceGenerator(
+            token=vbee_token, app_id=vbee_app_id, max_concurrency=max_concurrency
+        )
     
     def generate_voice_from_file(self, summary_file_path: str, output_dir: str = None, 
                                 voice_code: str = "", speed_rate: str = "1.0", 
@@ -149,6 +156,8 @@ class VoiceTool:
             'audio_files_count': len(voice_result.get('audio_files', [])),
             'total_sections': voice_result.get('total_sections', 0),
             'total_chunks': voice_result.get('total_chunks', 0),
+            'failed_sections': voice_result.get('failed_sections', []),
+            'failed_chunks': voice_result.get('failed_chunks', []),
             'output_directory': voice_result.get('output_directory', ''),
             'success': voice_result.get('success', False),
             'error': voice_result.get('error', None)